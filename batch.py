@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Batch Rendering
+Renders large numbers of figure variants without the pyplot state machine
+
+Each worker process owns one Figure attached to an Agg canvas and reuses it
+for every job (clear, resize, draw, save), so no figure managers pile up.
+After each job the worker checks its resident memory and retires when it
+exceeds the cap; the parent then starts a fresh worker for the remaining
+jobs. Worker crashes are reported as failed jobs instead of hanging the batch.
+Jobs draw with the same draw_* functions as response.py, and each job is
+cleared, drawn, laid out and saved inside the style's rc_context (usetex
+reads the font family and LaTeX preamble at draw time), so batch variants
+look exactly like the paper figures.
+"""
+
+import multiprocessing as mp
+import os
+import queue
+import traceback
+from collections import namedtuple
+from time import perf_counter
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from response import draw_threshold_sensitivity
+from styles import set_style, use_style
+
+# render(fig, **params) 在空白 Figure 上绘图，例如 response 中的 draw_* 函数
+RenderJob = namedtuple("RenderJob", ["render", "path", "figsize", "params", "dpi"])
+RenderJob.__new__.__defaults__ = ((6, 6), None, 300)
+
+BatchReport = namedtuple(
+    "BatchReport", ["figures", "failures", "seconds", "throughput", "recycled"]
+)
+
+
+# ---- 工作进程 ----
+
+
+def _rss_mb():
+    """当前进程常驻内存（MB）"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+
+        # 非 Linux 平台只能取峰值（macOS 单位为字节）
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if os.uname().sysname == "Darwin" else peak / 2**10
+
+
+def _worker(conn, results, max_memory_mb, style):
+    if style is not None:
+        # 样式在进程内只编译一次，@styled 的绘图函数和 use_style() 使用该样式
+        set_style(style)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    pid = os.getpid()
+    while True:
+        item = conn.recv()
+        if item is None:
+            break
+        index, job = item
+        try:
+            # 布局和保存时也要在样式中进行：usetex 的字体和导言区在绘制时才读取
+            with use_style():
+                fig.clear()
+                fig.set_size_inches(job.figsize)
+                job.render(fig, **(job.params or {}))
+                fig.tight_layout()
+                fig.savefig(job.path, dpi=job.dpi, bbox_inches="tight")
+            kind, detail = "done", None
+        except Exception:
+            kind, detail = "error", traceback.format_exc()
+        # 是否退出与结果一起报告，父进程不会再给即将退出的进程分配任务
+        retire = bool(max_memory_mb) and _rss_mb() > max_memory_mb
+        results.put((kind, pid, index, retire, detail))
+        if retire:
+            break
+
+
+def render_batch(jobs, workers=None, max_memory_mb=1024, style=None):
+    """并行渲染所有 RenderJob，返回 BatchReport
+
+    max_memory_mb 为单个工作进程的内存上限，超过后该进程退出并由新进程接替；
+    style 为 styles.STYLES 中的样式名，None 时使用 styles 的默认样式。
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return BatchReport(0, [], 0.0, 0.0, 0)
+    workers = min(workers or os.cpu_count(), len(jobs))
+    ctx = mp.get_context()
+    results = ctx.Queue()
+
+    # 每个工作进程有自己的任务管道，父进程在发送前记录 pid -> 任务
+    processes = {}
+    idle = []
+    running = {}
+    finished = set()
+    failures = []
+    recycled = 0
+    next_job = 0
+
+    def start_worker():
+        receiver, sender = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_worker,
+            args=(receiver, results, max_memory_mb, style),
+            daemon=True,
+        )
+        process.start()
+        receiver.close()
+        processes[process.pid] = (process, sender)
+        idle.append(process.pid)
+
+    def stop_worker(pid):
+        process, sender = processes.pop(pid)
+        if pid in idle:
+            idle.remove(pid)
+        sender.close()
+        process.join()
+
+    def fail(index, error):
+        finished.add(index)
+        failures.append((jobs[index].path, error))
+
+    start = perf_counter()
+    for _ in range(workers):
+        start_worker()
+
+    while len(finished) < len(jobs):
+        # 把剩余任务分配给空闲进程
+        while idle and next_job < len(jobs):
+            pid = idle.pop()
+            running[pid] = next_job
+            try:
+                processes[pid][1].send((next_job, jobs[next_job]))
+            except OSError:
+                # 进程已退出，任务留给下一个进程，退出的进程在下面回收
+                del running[pid]
+                continue
+            except Exception:
+                # 任务无法序列化
+                del running[pid]
+                idle.append(pid)
+                fail(next_job, traceback.format_exc())
+            next_job += 1
+
+        try:
+            kind, pid, index, retire, detail = results.get(timeout=1.0)
+        except queue.Empty:
+            # 工作进程异常退出（如被 OOM 杀死）时，把它正在处理的任务记为失败，
+            # 仍有任务时启动新进程接替
+            for pid, (process, _) in list(processes.items()):
+                if process.exitcode is None:
+                    continue
+                stop_worker(pid)
+                recycled += 1
+                if pid in running:
+                    fail(running.pop(pid), f"worker exited with {process.exitcode}")
+                if next_job < len(jobs):
+                    start_worker()
+            continue
+
+        running.pop(pid, None)
+        if index not in finished:
+            if kind == "done":
+                finished.add(index)
+            else:
+                fail(index, detail)
+        if pid not in processes:
+            continue
+        if retire:
+            stop_worker(pid)
+            recycled += 1
+            if next_job < len(jobs):
+                start_worker()
+        else:
+            idle.append(pid)
+
+    for pid in list(processes):
+        try:
+            processes[pid][1].send(None)
+        except OSError:
+            pass
+        stop_worker(pid)
+    seconds = perf_counter() - start
+    rendered = len(jobs) - len(failures)
+    return BatchReport(rendered, failures, seconds, rendered / seconds, recycled)
+
+
+def main():
+    """为多个数据集生成阈值敏感性图的变体"""
+    out_dir = "batch_figures"
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(0)
+    thresholds = [5, 10, 20, 30, 50, 75, 100]
+    base = np.array([0.75, 0.92, 0.95, 0.96, 0.94, 0.88, 0.82])
+
+    jobs = []
+    for d in range(200):
+        detection_data = {
+            f"Dataset {d}-{k}": np.clip(base + rng.normal(0, 0.02, base.size), 0, 1)
+            for k in range(3)
+        }
+        jobs.append(
+            RenderJob(
+                draw_threshold_sensitivity,
+                os.path.join(out_dir, f"threshold_{d:03d}.png"),
+                (6, 6),
+                dict(thresholds=thresholds, detection_data=detection_data),
+            )
+        )
+
+    print(f"Rendering {len(jobs)} figures...")
+    report = render_batch(jobs)
+    print(
+        f"Rendered {report.figures} figures in {report.seconds:.1f}s "
+        f"({report.throughput:.1f} figures/s), "
+        f"{report.recycled} workers recycled, {len(report.failures)} failures"
+    )
+    for path, error in report.failures:
+        print(f"Failed: {path}\n{error}")
+
+
+if __name__ == "__main__":
+    main()
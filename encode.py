@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Image Encoding
+Encodes rendered RGBA buffers off the render thread
+
+The figure is drawn on the calling thread through savefig's raw RGBA output
+with the same bounding box savefig would use, so the pixels match
+savefig(bbox_inches=...) exactly and the figure can be closed right away.
+PNG encoding runs in a thread pool: rows are filtered with numpy and
+compressed with zlib, which releases the GIL, so several figures encode in
+parallel while the next one renders. Palette quantization and WebP output
+need Pillow; WebP files get a .webp extension whatever name the caller
+passed.
+"""
+
+import io
+import os
+import struct
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_FILTERS = {"none": 0, "sub": 1, "up": 2}
+FORMATS = ("png", "webp", "webp-lossless")
+EXTENSIONS = {"png": ".png", "webp": ".webp", "webp-lossless": ".webp"}
+
+EncodeReport = namedtuple(
+    "EncodeReport",
+    ["path", "format", "size", "render_seconds", "encode_seconds", "nbytes"],
+)
+
+
+def render_rgba(fig, dpi=300, tight=True, pad_inches=0.1, bbox=None):
+    """在当前线程中绘制图片，返回 RGBA 数组
+
+    像素与 fig.savefig(dpi=dpi, bbox_inches=...) 的结果相同：tight 时使用
+    紧凑边界框，bbox（英寸）给定时直接使用（如 layout 缓存的结果）。
+    """
+    if bbox is None and tight:
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="raw", dpi=dpi, bbox_inches=bbox)
+    # Agg 画布宽度与 savefig 一样取 int(宽度 * dpi)
+    width = int((fig.bbox_inches if bbox is None else bbox).width * dpi)
+    return np.frombuffer(buffer.getvalue(), dtype=np.uint8).reshape(-1, width, 4)
+
+
+def crop_rgba(rgba, bbox, dpi, fill=(255, 255, 255, 255)):
+    """按边界框（英寸）裁剪已绘制画布的 RGBA 数组，尺寸与 savefig(bbox_inches=bbox) 相同
+
+    超出画布的部分用 fill 填充；偏移取整到像素，与 savefig 可能相差不到一个像素的平移。
+    """
+    height, canvas_width = rgba.shape[:2]
+    width = int(bbox.width * dpi)
+    out_height = int(bbox.height * dpi)
+    # savefig 以边界框左下角为原点
+    left = int(round(bbox.x0 * dpi))
+    top = height - int(round(bbox.y0 * dpi)) - out_height
+    out = np.empty((out_height, width, 4), dtype=np.uint8)
+    out[:] = fill
+    x0, x1 = max(left, 0), min(left + width, canvas_width)
+    y0, y1 = max(top, 0), min(top + out_height, height)
+    if x0 < x1 and y0 < y1:
+        out[y0 - top : y1 - top, x0 - left : x1 - left] = rgba[y0:y1, x0:x1]
+    return out
+
+
+def _png_chunk(kind, data):
+    chunk = kind + data
+    return struct.pack(">I", len(data)) + chunk + struct.pack(">I", zlib.crc32(chunk))
+
+
+def encode_png(rgba, level=6, png_filter="up", dpi=None):
+    """把 RGBA 数组编码为 PNG 字节；完全不透明时省去 alpha 通道"""
+    if rgba[..., 3].min() == 255:
+        pixels, color_type = rgba[..., :3], 2
+    else:
+        pixels, color_type = rgba, 6
+    height, width, channels = pixels.shape
+    rows = np.ascontiguousarray(pixels).reshape(height, width * channels)
+
+    # 行过滤（uint8 运算自动按 256 取模）
+    if png_filter == "up":
+        filtered = rows.copy()
+        filtered[1:] -= rows[:-1]
+    elif png_filter == "sub":
+        filtered = rows.copy()
+        filtered[:, channels:] -= rows[:, :-channels]
+    elif png_filter == "none":
+        filtered = rows
+    else:
+        raise ValueError(f"Unknown PNG filter: {png_filter}")
+    raw = np.empty((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 0] = PNG_FILTERS[png_filter]
+    raw[:, 1:] = filtered
+
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    chunks = [PNG_SIGNATURE, _png_chunk(b"IHDR", header)]
+    if dpi is not None:
+        ppm = int(round(dpi / 0.0254))
+        chunks.append(_png_chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1)))
+    chunks.append(_png_chunk(b"IDAT", zlib.compress(raw.tobytes(), level)))
+    chunks.append(_png_chunk(b"IEND", b""))
+    return b"".join(chunks)
+
+
+def _require_pillow(feature):
+    if Image is None:
+        raise RuntimeError(f"Pillow is required for {feature}")
+
+
+def encode_palette_png(rgba, colors=256, level=6, dpi=None):
+    """量化为调色板后编码 PNG（有损，适合色彩较少的统计图）"""
+    _require_pillow("palette quantization")
+    image = Image.fromarray(rgba, "RGBA").quantize(
+        colors=colors, method=Image.Quantize.FASTOCTREE
+    )
+    buffer = io.BytesIO()
+    extra = {"dpi": (dpi, dpi)} if dpi is not None else {}
+    image.save(buffer, "PNG", compress_level=level, **extra)
+    return buffer.getvalue()
+
+
+def encode_webp(rgba, lossless=False, quality=90):
+    """编码为 WebP"""
+    _require_pillow("WebP output")
+    buffer = io.BytesIO()
+    Image.fromarray(rgba, "RGBA").save(
+        buffer, "WEBP", lossless=lossless, quality=quality, method=4
+    )
+    return buffer.getvalue()
+
+
+class Encoder:
+    """后台编码线程池
+
+    fmt: "png"、"webp" 或 "webp-lossless"；level 为 zlib 压缩级别 (0-9)；
+    palette 为调色板颜色数（仅 PNG，需要 Pillow），None 表示不量化。
+    """
+
+    def __init__(
+        self,
+        fmt="png",
+        level=6,
+        png_filter="up",
+        palette=None,
+        quality=90,
+        workers=4,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+        if fmt != "png":
+            _require_pillow("WebP output")
+        elif palette is not None:
+            _require_pillow("palette quantization")
+        self.fmt = fmt
+        self.level = level
+        self.png_filter = png_filter
+        self.palette = palette
+        self.quality = quality
+        self.reports = []
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._futures = []
+
+    def encode(self, rgba, dpi=None):
+        """同步编码，返回字节"""
+        if self.fmt == "png" and self.palette is None:
+            return encode_png(rgba, self.level, self.png_filter, dpi)
+        if self.fmt == "png":
+            return encode_palette_png(rgba, self.palette, self.level, dpi)
+        return encode_webp(rgba, self.fmt == "webp-lossless", self.quality)
+
+    def _encode_to_file(self, rgba, path, dpi, render_seconds):
+        start = perf_counter()
+        data = self.encode(rgba, dpi)
+        with open(path, "wb") as f:
+            f.write(data)
+        return EncodeReport(
+            path,
+            self.fmt,
+            (rgba.shape[1], rgba.shape[0]),
+            render_seconds,
+            perf_counter() - start,
+            len(data),
+        )
+
+    def output_path(self, path):
+        """把文件扩展名换成与 fmt 一致的扩展名（如 figure.png -> figure.webp）"""
+        return os.path.splitext(path)[0] + EXTENSIONS[self.fmt]
+
+    def submit(self, rgba, path, dpi=None, render_seconds=0.0):
+        """提交一个已渲染的缓冲区，返回 Future[EncodeReport]
+
+        写入的文件扩展名与 fmt 一致，实际路径见 EncodeReport.path。
+        """
+        path = self.output_path(path)
+        future = self._pool.submit(
+            self._encode_to_file, rgba, path, dpi, render_seconds
+        )
+        self._futures.append(future)
+        return future
+
+    def save(self, fig, path, dpi=300, tight=True, bbox=None):
+        """在当前线程渲染 fig，编码交给后台线程；返回后即可关闭 fig"""
+        start = perf_counter()
+        rgba = render_rgba(fig, dpi, tight, bbox=bbox)
+        return self.submit(rgba, path, dpi, perf_counter() - start)
+
+    def wait(self):
+        """等待所有已提交的任务完成，返回全部报告"""
+        for future in self._futures:
+            self.reports.append(future.result())
+        self._futures = []
+        return self.reports
+
+    def close(self):
+        self.wait()
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def print_report(self):
+        for r in self.reports:
+            print(
+                f"{r.path}: {r.size[0]}x{r.size[1]} {r.format}, "
+                f"render {r.render_seconds:.2f}s, encode {r.encode_seconds:.2f}s, "
+                f"{r.nbytes / 1024:.0f} KiB"
+            )
+
+
+def main():
+    """用后台编码器生成跨域性能图和理论验证图"""
+    import response
+
+    with Encoder(level=6) as encoder:
+        response.ENCODER = encoder
+        response.create_cross_domain_performance()
+        response.create_theoretical_validation_table()
+    response.ENCODER = None
+    encoder.print_report()
+
+
+if __name__ == "__main__":
+    main()
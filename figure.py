@@ -13,69 +13,16 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib
-from matplotlib import font_manager
+
+from layout import save_figure
+from styles import current_style, set_style, styled
 
 # 设置后端
 matplotlib.use("Agg")
 
 
-# 添加字体文件并验证
-def setup_font(font_path):
-    try:
-        # 添加字体文件
-        font_manager.fontManager.addfont(font_path)
-        prop = font_manager.FontProperties(fname=font_path)
-
-        # 验证字体是否成功加载
-        if prop.get_name():
-            print(f"Successfully loaded font: {prop.get_name()}")
-        else:
-            raise Exception("Font not properly loaded")
-
-        return prop
-    except Exception as e:
-        print(f"Error loading font: {e}")
-        return None
-
-
-# 设置字体路径和加载字体
-font_path = "/backup/codes/actions-runner/_work/PhDThesis/PhDThesis/Times New Roman.ttf"
-font_prop = setup_font(font_path)
-
-# 基准字体大小及各元素字体大小比例
-BASE_FONT_SIZE = 20
-FONT_SCALES = {
-    'base': 1.0,           # 基准大小
-    'title': 1.4,         # 标题
-    'axis_label': 1.2,    # 坐标轴标签
-    'tick_label': 1.2,    # 刻度标签
-    'legend': 1.0,        # 图例
-    'annotation': 0.8,    # 注释
-}
-
-# 创建legend字体属性
-legend_font = font_manager.FontProperties(
-    family='serif',
-    size=BASE_FONT_SIZE * FONT_SCALES['legend'],
-    fname=font_path
-)
-
-# 全局字体设置
-plt.rcParams.update(
-    {
-        "font.family": "serif",
-        "font.serif": [font_prop.get_name() if font_prop else "serif"],
-        "font.size": BASE_FONT_SIZE * FONT_SCALES['base'],
-        "axes.titlesize": BASE_FONT_SIZE * FONT_SCALES['title'],
-        "axes.labelsize": BASE_FONT_SIZE * FONT_SCALES['axis_label'],
-        "xtick.labelsize": BASE_FONT_SIZE * FONT_SCALES['tick_label'],
-        "ytick.labelsize": BASE_FONT_SIZE * FONT_SCALES['tick_label'],
-        "legend.fontsize": BASE_FONT_SIZE * FONT_SCALES['legend'],
-    }
-)
-
-
 # First Plot - Efficiency vs. Number of Nodes
+@styled()
 def create_efficiency_plot():
     data = {
         "nodes": [1, 4, 8, 16, 24],
@@ -101,24 +48,21 @@ def create_efficiency_plot():
             linewidth=2,
         )
 
-    plt.title("Efficiency vs. Number of Nodes", pad=15, fontproperties=font_prop, 
-             fontsize=BASE_FONT_SIZE * FONT_SCALES['title'])
-    plt.xlabel("Number of Nodes", fontproperties=font_prop, 
-              fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
-    plt.ylabel("Efficiency", fontproperties=font_prop, 
-              fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
+    plt.title("Efficiency vs. Number of Nodes", pad=15)
+    plt.xlabel("Number of Nodes")
+    plt.ylabel("Efficiency")
     plt.ylim(0.0, 1.1)
     plt.xticks(range(0, 26, 5))
     plt.yticks()
     plt.xlim(0, 26)
-    plt.legend(frameon=True, prop=legend_font)
+    plt.legend(frameon=True)
     plt.grid(True, linestyle="--", alpha=0.7)
-    plt.tight_layout()
-    plt.savefig("efficiency.png", dpi=300, bbox_inches="tight")
+    save_figure(plt.gcf(), "efficiency.png", "efficiency")
     plt.close()
 
 
 # Second Plot - Optimization of Partition Setting
+@styled()
 def create_optimization_plot():
     data_updated = {
         "partition #": [25, 36, 49, 81, 100, 121],
@@ -141,10 +85,8 @@ def create_optimization_plot():
         linewidth=2,
     )
 
-    ax1.set_xlabel("Partition #", fontproperties=font_prop, 
-                  fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
-    ax1.set_ylabel("Repetition #", fontproperties=font_prop, 
-                  fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
+    ax1.set_xlabel("Partition #")
+    ax1.set_ylabel("Repetition #")
     ax1.tick_params(axis="both")
     ax1.axvline(x=100, color="red", linestyle="--", linewidth=1.5)
 
@@ -154,10 +96,9 @@ def create_optimization_plot():
         xy=(100, 1),
         xytext=(105, 2),
         arrowprops=dict(facecolor="red", shrink=0.05),
-        fontsize=BASE_FONT_SIZE * FONT_SCALES['annotation'],
+        fontsize=current_style().sizes["annotation"],
         color="red",
         fontweight="bold",
-        fontproperties=font_prop,
     )
 
     ax1.set_ylim(0, 8)
@@ -175,14 +116,12 @@ def create_optimization_plot():
         linewidth=2,
     )
 
-    ax2.set_ylabel("Time(s)", fontproperties=font_prop, 
-                  fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
+    ax2.set_ylabel("Time(s)")
     ax2.tick_params(axis="y")
     ax2.set_ylim(0, 4000)
     ax2.set_yticks(range(0, 4500, 500))
 
-    plt.title("Optimisation of Partition Setting", pad=15, fontproperties=font_prop,
-             fontsize=BASE_FONT_SIZE * FONT_SCALES['title'])
+    plt.title("Optimisation of Partition Setting", pad=15)
     ax1.grid(True, linestyle="--", alpha=0.7)
 
     # Combine legends
@@ -193,17 +132,14 @@ def create_optimization_plot():
         labels1 + labels2,
         loc="upper right",
         frameon=True,
-        prop=legend_font
     )
 
-    plt.tight_layout()
-    plt.savefig("optimisation.png", dpi=300, bbox_inches="tight")
+    save_figure(plt.gcf(), "optimisation.png", "optimization")
     plt.close()
 
 
 def main():
-    if font_prop is None:
-        print("Warning: Using default font as Times New Roman could not be loaded")
+    set_style("thesis")
 
     create_efficiency_plot()
     create_optimization_plot()
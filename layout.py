@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Layout Cache
+Caches tight_layout margins and the tight bounding box between renders
+
+tight_layout() followed by savefig(bbox_inches="tight") measures every text
+extent several times, which is slow with usetex. The result only depends on
+the figure template, the style (its compiled rcParams, including the font
+that was resolved on this machine) and the text that sits around the axes,
+so it is cached on disk under a key built from those. On a hit the stored subplot
+parameters are applied with subplots_adjust() and the stored box is passed to
+savefig() directly, leaving a single draw.
+
+Only text that can move the layout enters the key: titles, axis labels,
+tick labels, suptitles, figure-level texts and legends, and axes legends or
+texts placed outside the axes. Legends and texts inside the axes are left
+out, so figures that differ only in data or legend entries share entries.
+"""
+
+import hashlib
+import json
+import os
+
+import matplotlib as mpl
+from matplotlib.transforms import Bbox
+
+from styles import current_style
+
+SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+
+def _outside_axes(ax, artist):
+    """artist 的锚点是否位于坐标轴区域之外"""
+    point = artist.get_transform().transform(artist.get_position())
+    x, y = ax.transAxes.inverted().transform(point)
+    return not (0 <= x <= 1 and 0 <= y <= 1)
+
+
+def _axis_signature(ax):
+    signature = {
+        "titles": [ax.get_title(loc) for loc in ("left", "center", "right")],
+        "xlabel": ax.get_xlabel(),
+        "ylabel": ax.get_ylabel(),
+        "ylabel_side": ax.yaxis.get_label_position(),
+        "xticks": [t.get_text() for t in ax.get_xticklabels()],
+        "yticks": [t.get_text() for t in ax.get_yticklabels()],
+        "rotation": [t.get_rotation() for t in ax.get_xticklabels()[:1]],
+        "position": [round(v, 4) for v in ax.get_position().bounds],
+    }
+    legend = ax.get_legend()
+    if legend is not None and legend.get_bbox_to_anchor() is not ax.bbox:
+        signature["legend"] = [t.get_text() for t in legend.get_texts()]
+    signature["texts"] = [t.get_text() for t in ax.texts if _outside_axes(ax, t)]
+    return signature
+
+
+def _text_signature(text):
+    return [
+        text.get_text(),
+        [round(v, 4) for v in text.get_position()],
+        text.get_rotation(),
+        text.get_horizontalalignment(),
+        text.get_verticalalignment(),
+        text.get_fontsize(),
+    ]
+
+
+def _figure_signature(fig):
+    """图片级的文字和图例（可能扩展紧凑边界框）"""
+    return {
+        "texts": [_text_signature(t) for t in fig.texts],
+        "legends": [
+            {
+                "entries": [t.get_text() for t in legend.get_texts()],
+                "title": legend.get_title().get_text(),
+                "loc": legend._loc,
+                "anchor": [round(v, 4) for v in legend.get_bbox_to_anchor().bounds],
+            }
+            for legend in fig.legends
+        ],
+    }
+
+
+def layout_key(fig, template, dpi):
+    """由模板名、样式、尺寸和影响布局的文字生成缓存键
+
+    样式部分包含编译后的 rcParams（其中的字体取决于本机找到的字体文件），
+    字体变化后旧的边界框不会被误用。
+    """
+    style = current_style()
+    signature = {
+        "template": template,
+        "style": [style.name, style.sizes, style.rc, mpl.rcParams["text.usetex"]],
+        "figsize": [round(v, 4) for v in fig.get_size_inches()],
+        "dpi": dpi,
+        "matplotlib": mpl.__version__,
+        "suptitle": fig.get_suptitle(),
+        "axes": [_axis_signature(ax) for ax in fig.axes],
+        "figure": _figure_signature(fig),
+    }
+    encoded = json.dumps(signature, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class LayoutCache:
+    """磁盘上的布局缓存：键 -> 子图参数与紧凑边界框（英寸）"""
+
+    def __init__(self, path=".layout_cache.json", pad_inches=0.1):
+        self.path = path
+        self.pad_inches = pad_inches
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _write(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def apply(self, fig, template, dpi=300):
+        """应用（或计算并缓存）布局，返回用于 savefig 的边界框"""
+        key = layout_key(fig, template, dpi)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            fig.subplots_adjust(**entry["subplotpars"])
+            return Bbox.from_extents(*entry["bbox"])
+
+        self.misses += 1
+        fig.set_dpi(dpi)
+        fig.tight_layout()
+        renderer = fig.canvas.get_renderer()
+        bbox = fig.get_tightbbox(renderer).padded(self.pad_inches)
+        self.entries[key] = {
+            "template": template,
+            "subplotpars": {
+                name: getattr(fig.subplotpars, name) for name in SUBPLOT_PARAMS
+            },
+            "bbox": list(bbox.extents),
+        }
+        self._write()
+        return bbox
+
+
+_default_cache = None
+
+
+def default_cache():
+    """当前目录下的默认布局缓存"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LayoutCache()
+    return _default_cache
+
+
+def save_figure(fig, filename, template, dpi=300, cache=None, encoder=None):
+    """使用缓存的布局保存图片；encoder 为 encode.Encoder 时在后台编码"""
+    cache = default_cache() if cache is None else cache
+    bbox = cache.apply(fig, template, dpi)
+    if encoder is None:
+        fig.savefig(filename, dpi=dpi, bbox_inches=bbox)
+    else:
+        encoder.save(fig, filename, dpi=dpi, bbox=bbox)
+    return bbox
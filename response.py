@@ -5,41 +5,60 @@ DiMergeCo Figure Generation Script
 Generates all required figures for peer review response
 """
 
-import pandas as pd
+import os
+
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib import font_manager
-import matplotlib.patches as mpatches
-
-# LaTeX配置
-plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": "serif",
-    "font.serif": ["Times New Roman"],
-    "text.latex.preamble": r"\usepackage{amsmath}"
-})
-
-# Font configuration
-try:
-    font_prop = font_manager.FontProperties(family="Times New Roman")
-    legend_font = font_manager.FontProperties(family="Times New Roman", size=10)
-except:
-    font_prop = None
-    legend_font = None
-    print("Warning: Times New Roman not found, using default font")
-
-# Font sizes
-BASE_FONT_SIZE = 12
-FONT_SCALES = {"title": 1.2, "axis_label": 1.0, "tick_label": 0.9, "legend": 0.9}
-
-# Color scheme
-COLORS = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3", "#ff7f00", "#ffff33"]
-MARKERS = ["o", "s", "^", "D", "v", "*"]
-
-
-def create_small_cocluster_detection():
-    """创建小co-cluster检测性能图"""
+
+import layout
+import vector_export
+from styles import current_style, styled
+
+# 可选的后台编码器（encode.Encoder），设置后 PNG 在后台线程中编码
+ENCODER = None
+
+# 额外导出的矢量格式，例如 ("pdf",)；密集的绘图对象会被自动栅格化
+VECTOR_FORMATS = ()
+
+# 可选的多页 PDF（vector_export.MultipageExport），设置后每张图写为其中一页
+PDF_PAGES = None
+
+
+def save_figure(filename, template):
+    """使用缓存的布局保存当前图片，template 标识共享几何布局的一类图"""
+    fig = plt.gcf()
+    bbox = layout.save_figure(fig, filename, template, dpi=300, encoder=ENCODER)
+    stem = os.path.splitext(filename)[0]
+    for fmt in VECTOR_FORMATS:
+        report = vector_export.export(fig, f"{stem}.{fmt}", bbox=bbox)
+        vector_export.print_report(report)
+    if PDF_PAGES is not None:
+        PDF_PAGES.add(fig, bbox=bbox)
+
+
+def load_store_series(store, dataset, methods, parameter, metric):
+    """从结果库读取各方法的序列（多个 seed 取均值），返回 (x, {method: y})"""
+    x = None
+    data = {}
+    for method in methods:
+        method_x, mean, _ = store.series(dataset, method, parameter, metric)
+        if x is None:
+            x = method_x
+        elif not np.array_equal(method_x, x):
+            raise ValueError(f"Method {method!r} uses different parameter values")
+        data[method] = mean
+    return x, data
+
+
+@styled(figure="small_cocluster")
+def create_small_cocluster_detection(store=None, dataset="Synthetic"):
+    """创建小co-cluster检测性能图
+
+    store 为 result_store.ResultStore 时从结果库读取 NMI/ARI，
+    否则使用下面的论文数据。
+    """
     print("Creating small co-cluster detection figures...")
+    style = current_style()
 
     # 准备数据
     sizes = ["5x5", "10x10", "15x15", "20x20"]
@@ -61,40 +80,35 @@ def create_small_cocluster_detection():
         "DiMergeCo-SCC": [0.23, 0.42, 0.55, 0.62],
     }
 
+    if store is not None:
+        size_values, nmi_data = load_store_series(
+            store, dataset, methods, "cocluster_size", "nmi"
+        )
+        _, ari_data = load_store_series(
+            store, dataset, methods, "cocluster_size", "ari"
+        )
+        sizes = [f"{int(n)}x{int(n)}" for n in size_values]
+
     # 绘制NMI图
     plt.figure(figsize=(8, 6))
     for i, method in enumerate(methods):
         plt.plot(
             sizes,
             nmi_data[method],
-            marker=MARKERS[i],
+            marker=style.markers[i],
             markersize=8,
             label=method,
-            color=COLORS[i],
+            color=style.colors[i],
             linewidth=2,
         )
 
-    plt.title(
-        "NMI for small co-clusters",
-        pad=15,
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["title"],
-    )
-    plt.xlabel(
-        "Co-cluster Size",
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["axis_label"],
-    )
-    plt.ylabel(
-        "Normalized Mutual Information",
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["axis_label"],
-    )
+    plt.title("NMI for small co-clusters", pad=15)
+    plt.xlabel("Co-cluster Size")
+    plt.ylabel("Normalized Mutual Information")
     plt.grid(True, linestyle="--", alpha=0.7)
     plt.ylim(0.0, 1.0)
-    plt.legend(frameon=True, prop=legend_font)
-    plt.tight_layout()
-    plt.savefig("nmi_small.png", dpi=300, bbox_inches="tight")
+    plt.legend(frameon=True)
+    save_figure("nmi_small.png", "small_cocluster")
     plt.close()
 
     # 绘制ARI图
@@ -103,34 +117,20 @@ def create_small_cocluster_detection():
         plt.plot(
             sizes,
             ari_data[method],
-            marker=MARKERS[i],
+            marker=style.markers[i],
             markersize=8,
             label=method,
-            color=COLORS[i],
+            color=style.colors[i],
             linewidth=2,
         )
 
-    plt.title(
-        "ARI for small co-clusters",
-        pad=15,
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["title"],
-    )
-    plt.xlabel(
-        "Co-cluster Size",
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["axis_label"],
-    )
-    plt.ylabel(
-        "Adjusted Rand Index",
-        fontproperties=font_prop,
-        fontsize=BASE_FONT_SIZE * FONT_SCALES["axis_label"],
-    )
+    plt.title("ARI for small co-clusters", pad=15)
+    plt.xlabel("Co-cluster Size")
+    plt.ylabel("Adjusted Rand Index")
     plt.grid(True, linestyle="--", alpha=0.7)
     plt.ylim(0.0, 1.0)
-    plt.legend(frameon=True, prop=legend_font)
-    plt.tight_layout()
-    plt.savefig("ari_small.png", dpi=300, bbox_inches="tight")
+    plt.legend(frameon=True)
+    save_figure("ari_small.png", "small_cocluster")
     plt.close()
 
     print("Small co-cluster detection figures saved:")
@@ -138,168 +138,166 @@ def create_small_cocluster_detection():
     print("2. ari_small.png - Small co-cluster ARI performance")
 
 
-def create_parameter_sensitivity():
-    """创建参数敏感性分析图"""
-    print("Creating parameter sensitivity analysis figures...")
+SENSITIVITY_DATASETS = ["CLASSIC4", "Amazon", "RCV1-Large"]
 
-    # 为这些特定图定义更大的字体大小
-    AXIS_LABEL_FONT_SIZE = 18
-    TICK_LABEL_FONT_SIZE = 16
-    LEGEND_FONT_SIZE = 16
-    TEXT_FONT_SIZE = 16
 
-    # 如果可能，更新图例字体属性
-    try:
-        local_legend_font = font_manager.FontProperties(
-            family="Times New Roman", size=LEGEND_FONT_SIZE
+# 敏感性图尺寸较小，使用样式中 "sensitivity" 的较大字号
+@styled(figure="sensitivity")
+def draw_block_size_sensitivity(fig, partitions, nmi_data):
+    """在 fig 上绘制块大小敏感性图，nmi_data 为 {数据集: 各分区数下的 NMI}"""
+    style = current_style()
+    ax = fig.add_subplot()
+    for i, (dataset, nmi) in enumerate(nmi_data.items()):
+        ax.plot(
+            partitions,
+            nmi,
+            marker=style.markers[i],
+            markersize=8,
+            label=dataset,
+            color=style.colors[i],
+            linewidth=2,
         )
-    except:
-        local_legend_font = font_manager.FontProperties(size=LEGEND_FONT_SIZE)
 
-    # --- 图 1: 块大小敏感性 ---
-    plt.figure(figsize=(6, 6))
+    ax.axvline(x=100, color="red", linestyle="--", alpha=0.7)
+    ax.text(
+        105, 0.85, "Optimal\nRegion", fontsize=style.sizes["annotation"], color="red"
+    )
 
-    partitions = [25, 49, 81, 100, 121, 144, 196]
-    datasets = ["CLASSIC4", "Amazon", "RCV1-Large"]
+    ax.set_xlabel("Number of Partitions")
+    ax.set_ylabel("Normalized Mutual Information")
 
-    nmi_classic4 = [0.72, 0.78, 0.83, 0.86, 0.84, 0.82, 0.79]
-    nmi_amazon = [0.68, 0.74, 0.79, 0.82, 0.80, 0.78, 0.75]
-    nmi_rcv1 = [0.70, 0.76, 0.81, 0.84, 0.82, 0.80, 0.77]
-    nmi_data = [nmi_classic4, nmi_amazon, nmi_rcv1]
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.set_ylim(0.65, 0.90)
+    ax.legend()
 
-    for i, dataset in enumerate(datasets):
-        plt.plot(
-            partitions,
-            nmi_data[i],
-            marker=MARKERS[i],
+
+@styled(figure="sensitivity")
+def draw_threshold_sensitivity(fig, thresholds, detection_data):
+    """在 fig 上绘制阈值敏感性图，detection_data 为 {数据集: 各阈值下的检测率}"""
+    style = current_style()
+    ax = fig.add_subplot()
+    for i, (dataset, rates) in enumerate(detection_data.items()):
+        ax.plot(
+            thresholds,
+            rates,
+            marker=style.markers[i],
             markersize=8,
             label=dataset,
-            color=COLORS[i],
+            color=style.colors[i],
             linewidth=2,
         )
 
-    plt.axvline(x=100, color="red", linestyle="--", alpha=0.7)
-    plt.text(105, 0.85, "Optimal\nRegion", fontsize=TEXT_FONT_SIZE, color="red")
+    ax.axvspan(10, 50, alpha=0.2, color="green", label="Robust Range")
 
-    plt.xlabel(
-        "Number of Partitions", fontproperties=font_prop, fontsize=AXIS_LABEL_FONT_SIZE
-    )
-    plt.ylabel(
-        "Normalized Mutual Information",
-        fontproperties=font_prop,
-        fontsize=AXIS_LABEL_FONT_SIZE,
+    ax.set_xlabel("Minimum Co-cluster Size ($T_m = T_n$)")
+    ax.set_ylabel("Co-cluster Detection Rate")
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+    lowest = min(np.min(rates) for rates in detection_data.values())
+    ax.set_ylim(min(0.70, lowest - 0.02), 1.00)
+    ax.legend()
+
+
+@styled(figure="sensitivity")
+def draw_probability_sensitivity(fig, prob_thresholds, ari_data, errors):
+    """在 fig 上绘制概率阈值敏感性图，ari_data / errors 按数据集给出"""
+    style = current_style()
+    ax = fig.add_subplot()
+    for i, (dataset, ari) in enumerate(ari_data.items()):
+        ax.errorbar(
+            prob_thresholds,
+            ari,
+            yerr=errors[dataset],
+            marker=style.markers[i],
+            markersize=8,
+            label=dataset,
+            color=style.colors[i],
+            linewidth=2,
+            capsize=4,
+        )
+
+    ax.axvline(x=0.95, color="red", linestyle="--", alpha=0.7)
+    ax.text(
+        0.95,
+        0.76,
+        "Optimal: 0.95",
+        fontsize=style.sizes["annotation"],
+        color="red",
+        ha="center",
     )
 
-    plt.grid(True, linestyle="--", alpha=0.7)
-    plt.ylim(0.65, 0.90)
-    plt.legend(prop=local_legend_font)
-    plt.xticks(fontsize=TICK_LABEL_FONT_SIZE)
-    plt.yticks(fontsize=TICK_LABEL_FONT_SIZE)
+    ax.set_xlabel("Probability Threshold ($P_{thresh}$)")
+    ax.set_ylabel("Adjusted Rand Index")
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.set_ylim(0.50, 0.80)
+    ax.legend()
+
 
-    plt.tight_layout()
-    plt.savefig("parameter_sensitivity_block_size.png", dpi=300, bbox_inches="tight")
+@styled(figure="sensitivity")
+def create_parameter_sensitivity(detection_data=None):
+    """创建参数敏感性分析图
+
+    detection_data 为 {名称: 各阈值下的检测率}，例如
+    simulate.threshold_detection_data(thresholds) 的合成基准结果，曲线按其名称标注；
+    为 None 时使用论文数据。
+    """
+    print("Creating parameter sensitivity analysis figures...")
+
+    datasets = SENSITIVITY_DATASETS
+
+    # --- 图 1: 块大小敏感性 ---
+    partitions = [25, 49, 81, 100, 121, 144, 196]
+    nmi_classic4 = [0.72, 0.78, 0.83, 0.86, 0.84, 0.82, 0.79]
+    nmi_amazon = [0.68, 0.74, 0.79, 0.82, 0.80, 0.78, 0.75]
+    nmi_rcv1 = [0.70, 0.76, 0.81, 0.84, 0.82, 0.80, 0.77]
+    nmi_data = dict(zip(datasets, [nmi_classic4, nmi_amazon, nmi_rcv1]))
+
+    fig = plt.figure(figsize=(6, 6))
+    draw_block_size_sensitivity(fig, partitions, nmi_data)
+    save_figure("parameter_sensitivity_block_size.png", "sensitivity")
     plt.close()
     print("Parameter sensitivity analysis figures saved:")
     print("3a. parameter_sensitivity_block_size.png - Parameter sensitivity (block size)")
 
     # --- 图 2: 阈值参数敏感性 ---
-    plt.figure(figsize=(6, 6))
-
     thresholds = [5, 10, 20, 30, 50, 75, 100]
     detection_classic4 = [0.75, 0.92, 0.95, 0.96, 0.94, 0.88, 0.82]
     detection_amazon = [0.72, 0.89, 0.93, 0.94, 0.92, 0.85, 0.78]
     detection_rcv1 = [0.74, 0.91, 0.94, 0.95, 0.93, 0.87, 0.80]
-    detection_data = [detection_classic4, detection_amazon, detection_rcv1]
-
-    for i, dataset in enumerate(datasets):
-        plt.plot(
-            thresholds,
-            detection_data[i],
-            marker=MARKERS[i],
-            markersize=8,
-            label=dataset,
-            color=COLORS[i],
-            linewidth=2,
+    if detection_data is None:
+        detection_data = dict(
+            zip(datasets, [detection_classic4, detection_amazon, detection_rcv1])
         )
 
-    plt.axvspan(10, 50, alpha=0.2, color="green", label="Robust Range")
-
-    plt.xlabel(
-        "Minimum Co-cluster Size ($T_m = T_n$)",
-        fontproperties=font_prop,
-        fontsize=AXIS_LABEL_FONT_SIZE,
-    )
-    plt.ylabel(
-        "Co-cluster Detection Rate",
-        fontproperties=font_prop,
-        fontsize=AXIS_LABEL_FONT_SIZE,
-    )
-
-    plt.grid(True, linestyle="--", alpha=0.7)
-    plt.ylim(0.70, 1.00)
-    plt.legend(prop=local_legend_font)
-    plt.xticks(fontsize=TICK_LABEL_FONT_SIZE)
-    plt.yticks(fontsize=TICK_LABEL_FONT_SIZE)
-
-    plt.tight_layout()
-    plt.savefig("parameter_sensitivity_threshold.png", dpi=300, bbox_inches="tight")
+    fig = plt.figure(figsize=(6, 6))
+    draw_threshold_sensitivity(fig, thresholds, detection_data)
+    save_figure("parameter_sensitivity_threshold.png", "sensitivity")
     plt.close()
     print("Parameter sensitivity analysis figures saved:")
     print("3b. parameter_sensitivity_threshold.png - Parameter sensitivity (threshold)")
 
     # --- 图 3: 概率阈值敏感性 ---
-    plt.figure(figsize=(6, 6))
-
     prob_thresholds = [0.80, 0.85, 0.90, 0.95, 0.99]
     ari_classic4 = [0.68, 0.72, 0.75, 0.78, 0.74]
     ari_amazon = [0.62, 0.66, 0.69, 0.72, 0.68]
     ari_rcv1 = [0.65, 0.69, 0.72, 0.75, 0.71]
-    errors = [0.02, 0.025, 0.03]
-    ari_data = [ari_classic4, ari_amazon, ari_rcv1]
+    errors = dict(zip(datasets, [0.02, 0.025, 0.03]))
+    ari_data = dict(zip(datasets, [ari_classic4, ari_amazon, ari_rcv1]))
 
-    for i, dataset in enumerate(datasets):
-        plt.errorbar(
-            prob_thresholds,
-            ari_data[i],
-            yerr=errors[i],
-            marker=MARKERS[i],
-            markersize=8,
-            label=dataset,
-            color=COLORS[i],
-            linewidth=2,
-            capsize=4,
-        )
-
-    plt.axvline(x=0.95, color="red", linestyle="--", alpha=0.7)
-    plt.text(
-        0.95, 0.76, "Optimal: 0.95", fontsize=TEXT_FONT_SIZE, color="red", ha="center"
-    )
-
-    plt.xlabel(
-        "Probability Threshold ($P_{thresh}$)",
-        fontproperties=font_prop,
-        fontsize=AXIS_LABEL_FONT_SIZE,
-    )
-    plt.ylabel(
-        "Adjusted Rand Index", fontproperties=font_prop, fontsize=AXIS_LABEL_FONT_SIZE
-    )
-
-    plt.grid(True, linestyle="--", alpha=0.7)
-    plt.ylim(0.50, 0.80)
-    plt.legend(prop=local_legend_font)
-    plt.xticks(fontsize=TICK_LABEL_FONT_SIZE)
-    plt.yticks(fontsize=TICK_LABEL_FONT_SIZE)
-
-    plt.tight_layout()
-    plt.savefig("parameter_sensitivity_probability.png", dpi=300, bbox_inches="tight")
+    fig = plt.figure(figsize=(6, 6))
+    draw_probability_sensitivity(fig, prob_thresholds, ari_data, errors)
+    save_figure("parameter_sensitivity_probability.png", "sensitivity")
     plt.close()
     print("Parameter sensitivity analysis figures saved:")
     print("3c. parameter_sensitivity_probability.png - Parameter sensitivity (probability)")
 
 
+@styled(figure="optimization")
 def create_optimization_figure():
     """创建分区优化图"""
     print("Creating partition optimization figure...")
+    style = current_style()
 
     # 数据准备
     partitions = [25, 36, 49, 81, 100, 121]
@@ -311,8 +309,8 @@ def create_optimization_figure():
 
     # 左y轴 - 重复次数
     color1 = "#1f77b4"
-    ax1.set_xlabel("Number of Partitions", fontproperties=font_prop)
-    ax1.set_ylabel("Number of Repetitions", color=color1, fontproperties=font_prop)
+    ax1.set_xlabel("Number of Partitions")
+    ax1.set_ylabel("Number of Repetitions", color=color1)
     line1 = ax1.plot(
         partitions,
         repetitions,
@@ -328,7 +326,7 @@ def create_optimization_figure():
     # 右y轴 - 计算时间
     ax2 = ax1.twinx()
     color2 = "#ff7f0e"
-    ax2.set_ylabel("Computation Time (seconds)", color=color2, fontproperties=font_prop)
+    ax2.set_ylabel("Computation Time (seconds)", color=color2)
     line2 = ax2.plot(
         partitions,
         computation_time,
@@ -347,7 +345,7 @@ def create_optimization_figure():
         xy=(partitions[optimal_idx], repetitions[optimal_idx]),
         xytext=(partitions[optimal_idx] + 15, repetitions[optimal_idx] + 1),
         arrowprops=dict(arrowstyle="->", color="red"),
-        fontsize=11,
+        fontsize=style.sizes["annotation"],
         ha="center",
         bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
     )
@@ -355,8 +353,6 @@ def create_optimization_figure():
     # 设置标题和图例
     ax1.set_title(
         "Optimization of Partitioning Algorithm for Computational Efficiency",
-        fontproperties=font_prop,
-        fontsize=14,
         fontweight="bold",
         pad=20,
     )
@@ -364,122 +360,112 @@ def create_optimization_figure():
     # 合并图例
     lines1, labels1 = ax1.get_legend_handles_labels()
     lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper right", prop=legend_font)
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
 
-    plt.tight_layout()
-    plt.savefig("optimisation.png", dpi=300, bbox_inches="tight")
+    save_figure("optimisation.png", "optimization")
     plt.close()
 
     print("Optimization figure saved:")
     print("4. optimisation.png - Partition optimization")
 
 
+@styled()
+def draw_cross_domain(fig, domains, dimergeco, baseline):
+    """在 fig 上绘制跨域性能比较图
+
+    dimergeco / baseline 为 {"NMI": [...], "ARI": [...], "Runtime": [...]}。
+    """
+    axes = fig.subplots(1, 3)
+    x = np.arange(len(domains))
+    width = 0.35
+    panels = [
+        ("NMI", "Normalized Mutual Information", "(a) NMI Comparison"),
+        ("ARI", "Adjusted Rand Index", "(b) ARI Comparison"),
+        ("Runtime", "Runtime (seconds, log scale)", "(c) Runtime Comparison"),
+    ]
+    for ax, (key, ylabel, title) in zip(axes, panels):
+        ax.bar(
+            x - width / 2,
+            dimergeco[key],
+            width,
+            label="DiMergeCo",
+            color="#2E8B57",
+            alpha=0.8,
+        )
+        ax.bar(
+            x + width / 2,
+            baseline[key],
+            width,
+            label="Baseline",
+            color="#CD5C5C",
+            alpha=0.8,
+        )
+        ax.set_ylabel(ylabel)
+        ax.set_title(title, fontweight="bold")
+        ax.set_xticks(x)
+        ax.set_xticklabels(domains, rotation=15, ha="right")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        # Runtime 使用对数尺度
+        if key == "Runtime":
+            ax.set_yscale("log")
+        else:
+            ax.set_ylim(0, 1.0)
+
+
+@styled()
 def create_cross_domain_performance():
     """创建跨域性能比较图"""
     print("Creating cross-domain performance figure...")
 
     domains = ["Document", "Gene Expression", "Medical Image", "Sensor Network"]
-    metrics = ["NMI", "ARI", "Runtime (s)"]
 
     # 模拟数据
-    dimergeco_nmi = [0.85, 0.78, 0.72, 0.69]
-    baseline_nmi = [0.76, 0.71, 0.65, 0.62]
-
-    dimergeco_ari = [0.78, 0.74, 0.68, 0.65]
-    baseline_ari = [0.69, 0.67, 0.61, 0.58]
-
-    dimergeco_runtime = [512, 890, 1240, 1680]
-    baseline_runtime = [3420, 4560, 6780, 8900]
-
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-
-    x = np.arange(len(domains))
-    width = 0.35
+    dimergeco = {
+        "NMI": [0.85, 0.78, 0.72, 0.69],
+        "ARI": [0.78, 0.74, 0.68, 0.65],
+        "Runtime": [512, 890, 1240, 1680],
+    }
+    baseline = {
+        "NMI": [0.76, 0.71, 0.65, 0.62],
+        "ARI": [0.69, 0.67, 0.61, 0.58],
+        "Runtime": [3420, 4560, 6780, 8900],
+    }
 
-    # NMI对比
-    axes[0].bar(
-        x - width / 2,
-        dimergeco_nmi,
-        width,
-        label="DiMergeCo",
-        color="#2E8B57",
-        alpha=0.8,
-    )
-    axes[0].bar(
-        x + width / 2, baseline_nmi, width, label="Baseline", color="#CD5C5C", alpha=0.8
-    )
-    axes[0].set_ylabel("Normalized Mutual Information", fontproperties=font_prop)
-    axes[0].set_title("(a) NMI Comparison", fontproperties=font_prop, fontweight="bold")
-    axes[0].set_xticks(x)
-    axes[0].set_xticklabels(domains, rotation=15, ha="right")
-    axes[0].legend(prop=legend_font)
-    axes[0].grid(True, alpha=0.3)
-    axes[0].set_ylim(0, 1.0)
-
-    # ARI对比
-    axes[1].bar(
-        x - width / 2,
-        dimergeco_ari,
-        width,
-        label="DiMergeCo",
-        color="#2E8B57",
-        alpha=0.8,
-    )
-    axes[1].bar(
-        x + width / 2, baseline_ari, width, label="Baseline", color="#CD5C5C", alpha=0.8
-    )
-    axes[1].set_ylabel("Adjusted Rand Index", fontproperties=font_prop)
-    axes[1].set_title("(b) ARI Comparison", fontproperties=font_prop, fontweight="bold")
-    axes[1].set_xticks(x)
-    axes[1].set_xticklabels(domains, rotation=15, ha="right")
-    axes[1].legend(prop=legend_font)
-    axes[1].grid(True, alpha=0.3)
-    axes[1].set_ylim(0, 1.0)
-
-    # Runtime对比（对数尺度）
-    axes[2].bar(
-        x - width / 2,
-        dimergeco_runtime,
-        width,
-        label="DiMergeCo",
-        color="#2E8B57",
-        alpha=0.8,
-    )
-    axes[2].bar(
-        x + width / 2,
-        baseline_runtime,
-        width,
-        label="Baseline",
-        color="#CD5C5C",
-        alpha=0.8,
-    )
-    axes[2].set_ylabel("Runtime (seconds, log scale)", fontproperties=font_prop)
-    axes[2].set_title(
-        "(c) Runtime Comparison", fontproperties=font_prop, fontweight="bold"
-    )
-    axes[2].set_xticks(x)
-    axes[2].set_xticklabels(domains, rotation=15, ha="right")
-    axes[2].legend(prop=legend_font)
-    axes[2].grid(True, alpha=0.3)
-    axes[2].set_yscale("log")
-
-    plt.tight_layout()
-    plt.savefig("cross_domain_performance.png", dpi=300, bbox_inches="tight")
+    fig = plt.figure(figsize=(15, 5))
+    draw_cross_domain(fig, domains, dimergeco, baseline)
+    save_figure("cross_domain_performance.png", "cross_domain")
     plt.close()
 
     print("Cross-domain performance figure saved:")
     print("5. cross_domain_performance.png - Cross-domain performance comparison")
 
 
-def create_theoretical_validation_table():
-    """创建理论验证表格的可视化"""
+@styled()
+def create_theoretical_validation_table(
+    domains=None,
+    predicted_rates=None,
+    empirical_rates=None,
+    error_bounds=None,
+    actual_errors=None,
+):
+    """创建理论验证表格的可视化
+
+    未给出的数据使用论文中的数值；预测检测率和误差界可由
+    theory.validation_inputs() 计算后传入。
+    """
     print("Creating theoretical validation visualization...")
 
-    domains = ["Document", "Gene Expression", "Medical Image", "Sensor Network"]
-    predicted_rates = [0.97, 0.96, 0.95, 0.94]
-    empirical_rates = [0.95, 0.89, 0.90, 0.87]
-    error_bounds = [0.12, 0.15, 0.14, 0.16]
-    actual_errors = [0.13, 0.16, 0.15, 0.17]
+    if domains is None:
+        domains = ["Document", "Gene Expression", "Medical Image", "Sensor Network"]
+    if predicted_rates is None:
+        predicted_rates = [0.97, 0.96, 0.95, 0.94]
+    if empirical_rates is None:
+        empirical_rates = [0.95, 0.89, 0.90, 0.87]
+    if error_bounds is None:
+        error_bounds = [0.12, 0.15, 0.14, 0.16]
+    if actual_errors is None:
+        actual_errors = [0.13, 0.16, 0.15, 0.17]
 
     fig, axes = plt.subplots(2, 2, figsize=(12, 8))
 
@@ -492,17 +478,12 @@ def create_theoretical_validation_table():
     axes[0, 0].bar(
         x + 0.2, empirical_rates, 0.4, label="Empirical", color="#E15759", alpha=0.8
     )
-    axes[0, 0].set_ylabel("Detection Rate", fontproperties=font_prop)
-    axes[0, 0].set_title(
-        "(a) Predicted vs Empirical Detection Rates", fontproperties=font_prop
-    )
+    axes[0, 0].set_ylabel("Detection Rate")
+    axes[0, 0].set_title("(a) Predicted vs Empirical Detection Rates")
     axes[0, 0].set_xticks(x)
-    axes[0, 0].set_xticklabels(
-        domains, rotation=15, ha="right", fontproperties=font_prop
-    )
-    axes[0, 0].legend(prop=legend_font)
+    axes[0, 0].set_xticklabels(domains, rotation=15, ha="right")
+    axes[0, 0].legend()
     axes[0, 0].grid(True, alpha=0.3)
-    plt.setp(axes[0, 0].get_yticklabels(), fontproperties=font_prop)
 
     # 误差界限vs实际误差
     axes[0, 1].bar(
@@ -511,44 +492,34 @@ def create_theoretical_validation_table():
     axes[0, 1].bar(
         x + 0.2, actual_errors, 0.4, label="Actual Error", color="#FFC000", alpha=0.8
     )
-    axes[0, 1].set_ylabel("Error", fontproperties=font_prop)
-    axes[0, 1].set_title("(b) Error Bounds vs Actual Errors", fontproperties=font_prop)
+    axes[0, 1].set_ylabel("Error")
+    axes[0, 1].set_title("(b) Error Bounds vs Actual Errors")
     axes[0, 1].set_xticks(x)
-    axes[0, 1].set_xticklabels(
-        domains, rotation=15, ha="right", fontproperties=font_prop
-    )
-    axes[0, 1].legend(prop=legend_font)
+    axes[0, 1].set_xticklabels(domains, rotation=15, ha="right")
+    axes[0, 1].legend()
     axes[0, 1].grid(True, alpha=0.3)
-    plt.setp(axes[0, 1].get_yticklabels(), fontproperties=font_prop)
 
     # 检测率偏差
     deviation = [abs(p - e) / p * 100 for p, e in zip(predicted_rates, empirical_rates)]
     axes[1, 0].bar(x, deviation, color="#9E4794", alpha=0.8)
-    axes[1, 0].set_ylabel("Deviation (%)", fontproperties=font_prop)
-    axes[1, 0].set_title("(c) Prediction Deviation", fontproperties=font_prop)
+    axes[1, 0].set_ylabel("Deviation (%)")
+    axes[1, 0].set_title("(c) Prediction Deviation")
     axes[1, 0].set_xticks(x)
-    axes[1, 0].set_xticklabels(
-        domains, rotation=15, ha="right", fontproperties=font_prop
-    )
+    axes[1, 0].set_xticklabels(domains, rotation=15, ha="right")
     axes[1, 0].grid(True, alpha=0.3)
     axes[1, 0].axhline(y=8, color="red", linestyle="--", label="8% Threshold")
-    axes[1, 0].legend(prop=legend_font)
-    plt.setp(axes[1, 0].get_yticklabels(), fontproperties=font_prop)
+    axes[1, 0].legend()
 
     # 收敛步数
     convergence_steps = [7, 8, 9, 10]
     axes[1, 1].bar(x, convergence_steps, color="#A26D1A", alpha=0.8)
-    axes[1, 1].set_ylabel("Convergence Steps", fontproperties=font_prop)
-    axes[1, 1].set_title("(d) Algorithm Convergence", fontproperties=font_prop)
+    axes[1, 1].set_ylabel("Convergence Steps")
+    axes[1, 1].set_title("(d) Algorithm Convergence")
     axes[1, 1].set_xticks(x)
-    axes[1, 1].set_xticklabels(
-        domains, rotation=15, ha="right", fontproperties=font_prop
-    )
+    axes[1, 1].set_xticklabels(domains, rotation=15, ha="right")
     axes[1, 1].grid(True, alpha=0.3)
-    plt.setp(axes[1, 1].get_yticklabels(), fontproperties=font_prop)
 
-    plt.tight_layout()
-    plt.savefig("theoretical_validation.png", dpi=300, bbox_inches="tight")
+    save_figure("theoretical_validation.png", "theoretical_validation")
     plt.close()
 
     print("Theoretical validation visualization saved:")
@@ -560,9 +531,6 @@ def main():
     print("Starting DiMergeCo figure generation...")
     print("=" * 50)
 
-    if font_prop is None:
-        print("Warning: Using default font as Times New Roman could not be loaded")
-
     # 生成所有图片
     # create_small_cocluster_detection()
     create_parameter_sensitivity()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Result Store
+Columnar, append-only storage for experiment results with memory-mapped access
+
+Layout of a store directory:
+    x.f8         raw little-endian float64, parameter value of every point
+    y.f8         raw little-endian float64, metric value of every point
+    segments.bin one record per appended series (see SEGMENT_DTYPE)
+    meta.json    string vocabularies and committed row / segment counts
+
+A series is identified by (dataset, method, parameter, metric, seed) and is
+stored as one contiguous row range, so reading it back is a binary search in
+a sorted numpy index of the segment table plus a memmap slice; nothing
+outside the requested range is touched, and the index stays a few numpy
+arrays however many series the store holds.
+"""
+
+import json
+import os
+
+import numpy as np
+
+SEGMENT_DTYPE = np.dtype(
+    [
+        ("dataset", "<i4"),
+        ("method", "<i4"),
+        ("parameter", "<i4"),
+        ("metric", "<i4"),
+        ("seed", "<i8"),
+        ("start", "<i8"),
+        ("stop", "<i8"),
+    ]
+)
+VALUE_DTYPE = np.dtype("<f8")
+VOCABULARIES = ("dataset", "method", "parameter", "metric")
+KEY_FIELDS = VOCABULARIES + ("seed",)
+# 建索引后追加的段先线性查找，超过该数目时重建索引
+INDEX_TAIL = 4096
+
+
+class ResultStore:
+    """按 (dataset, method, parameter, metric, seed) 索引的列式结果库"""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        else:
+            meta = {"rows": 0, "segments": 0}
+            meta.update({name: [] for name in VOCABULARIES})
+        self.rows = meta["rows"]
+        self.n_segments = meta["segments"]
+        self.vocab = {name: list(meta[name]) for name in VOCABULARIES}
+        self._codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in self.vocab.items()
+        }
+        self._order = None
+        self._keys = None
+        self._indexed = 0
+        self._maps = {}
+
+    # ---- 内部工具 ----
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _code(self, vocabulary, value, create=False):
+        codes = self._codes[vocabulary]
+        if value not in codes:
+            if not create:
+                raise KeyError(f"Unknown {vocabulary}: {value!r}")
+            codes[value] = len(self.vocab[vocabulary])
+            self.vocab[vocabulary].append(value)
+        return codes[value]
+
+    def _map(self, name, dtype, count):
+        """只读 memmap，按已提交的长度截取（文件尾部可能有未提交的数据）"""
+        cached = self._maps.get(name)
+        if cached is not None and len(cached) >= count:
+            return cached[:count]
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        mapped = np.memmap(self._file(name), dtype=dtype, mode="r", shape=(count,))
+        self._maps[name] = mapped
+        return mapped
+
+    def _segments(self):
+        return self._map("segments.bin", SEGMENT_DTYPE, self.n_segments)
+
+    def _build_index(self):
+        """按键排序的段号及排序后的键列（numpy 数组，不建 Python 对象）"""
+        segments = self._segments()
+        columns = [np.asarray(segments[name]) for name in KEY_FIELDS]
+        # lexsort 以最后一个键为主键；段号作为最次要的键，同一键按追加顺序排列
+        order = np.lexsort([np.arange(len(segments))] + columns[::-1])
+        self._order = order
+        self._keys = {
+            name: column[order] for name, column in zip(KEY_FIELDS, columns)
+        }
+        self._indexed = len(segments)
+
+    def _lookup(self, codes):
+        """键（或其前缀）为 codes 的所有段号，同一键内按追加顺序排列"""
+        if self._order is None or self.n_segments - self._indexed > INDEX_TAIL:
+            self._build_index()
+        lo, hi = 0, self._indexed
+        for name, code in zip(KEY_FIELDS, codes):
+            column = self._keys[name][lo:hi]
+            lo, hi = (
+                lo + np.searchsorted(column, code, "left"),
+                lo + np.searchsorted(column, code, "right"),
+            )
+        tail = self._segments()[self._indexed :]
+        mask = np.ones(len(tail), dtype=bool)
+        for name, code in zip(KEY_FIELDS, codes):
+            mask &= tail[name] == code
+        tail_found = self._indexed + np.flatnonzero(mask)
+        return np.concatenate([self._order[lo:hi], tail_found])
+
+    def _write_meta(self):
+        meta = {"rows": self.rows, "segments": self.n_segments}
+        meta.update(self.vocab)
+        tmp_path = self._file("meta.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._file("meta.json"))
+
+    # ---- 写入 ----
+
+    def append(self, dataset, method, parameter, seed, x, **metrics):
+        """追加一次运行：同一组参数值 x 上的一个或多个指标序列
+
+        例如 store.append("CLASSIC4", "SCC", "partitions", 0, [25, 49], nmi=[...])
+        """
+        x = np.ascontiguousarray(x, dtype=VALUE_DTYPE)
+        if x.ndim != 1:
+            raise ValueError("x must be one-dimensional")
+        if not metrics:
+            raise ValueError("At least one metric series is required")
+        ys = {}
+        for metric, values in metrics.items():
+            values = np.ascontiguousarray(values, dtype=VALUE_DTYPE)
+            if values.shape != x.shape:
+                raise ValueError(
+                    f"Metric {metric!r} has {values.size} values, expected {x.size}"
+                )
+            ys[metric] = values
+
+        records = np.empty(len(ys), dtype=SEGMENT_DTYPE)
+        records["dataset"] = self._code("dataset", dataset, create=True)
+        records["method"] = self._code("method", method, create=True)
+        records["parameter"] = self._code("parameter", parameter, create=True)
+        records["seed"] = seed
+        start = self.rows
+        for i, metric in enumerate(ys):
+            records["metric"][i] = self._code("metric", metric, create=True)
+            records["start"][i] = start
+            records["stop"][i] = start + x.size
+            start += x.size
+
+        # 先截断到已提交长度，丢弃上次中断写入的残留数据
+        with open(self._file("x.f8"), "ab") as fx, open(self._file("y.f8"), "ab") as fy:
+            fx.truncate(self.rows * VALUE_DTYPE.itemsize)
+            fy.truncate(self.rows * VALUE_DTYPE.itemsize)
+            for values in ys.values():
+                fx.write(x.tobytes())
+                fy.write(values.tobytes())
+        with open(self._file("segments.bin"), "ab") as fs:
+            fs.truncate(self.n_segments * SEGMENT_DTYPE.itemsize)
+            fs.write(records.tobytes())
+
+        self.rows = start
+        self.n_segments += len(records)
+        self._maps.clear()
+        self._write_meta()
+
+    # ---- 读取 ----
+
+    def seeds(self, dataset, method, parameter, metric):
+        """返回某条序列已存储的所有 seed"""
+        prefix = (
+            self._code("dataset", dataset),
+            self._code("method", method),
+            self._code("parameter", parameter),
+            self._code("metric", metric),
+        )
+        found = self._lookup(prefix)
+        return np.unique(self._segments()["seed"][found]).tolist()
+
+    def get(self, dataset, method, parameter, metric, seed=0):
+        """取出单条序列 (x, y)，返回只读 memmap 视图，不复制数据"""
+        key = (
+            self._code("dataset", dataset),
+            self._code("method", method),
+            self._code("parameter", parameter),
+            self._code("metric", metric),
+            seed,
+        )
+        found = self._lookup(key)
+        if not len(found):
+            raise KeyError(f"No results for {(dataset, method, parameter, metric, seed)}")
+        # 同一键多次追加时取最新一次
+        segment = self._segments()[found[-1]]
+        start, stop = int(segment["start"]), int(segment["stop"])
+        x = self._map("x.f8", VALUE_DTYPE, self.rows)[start:stop]
+        y = self._map("y.f8", VALUE_DTYPE, self.rows)[start:stop]
+        return x, y
+
+    def series(self, dataset, method, parameter, metric, seeds=None):
+        """对多个 seed 求均值和标准差，返回 (x, mean, std)"""
+        if seeds is None:
+            seeds = self.seeds(dataset, method, parameter, metric)
+        if not seeds:
+            raise KeyError(f"No results for {(dataset, method, parameter, metric)}")
+        x, _ = self.get(dataset, method, parameter, metric, seeds[0])
+        stacked = np.empty((len(seeds), x.size), dtype=VALUE_DTYPE)
+        for i, seed in enumerate(seeds):
+            seed_x, stacked[i] = self.get(dataset, method, parameter, metric, seed)
+            if not np.array_equal(seed_x, x):
+                raise ValueError(f"Seed {seed} uses different parameter values")
+        return np.array(x), stacked.mean(axis=0), stacked.std(axis=0)
+
+    def __len__(self):
+        return self.rows
+
+
+def main():
+    """演示：写入小co-cluster结果并读回"""
+    store = ResultStore("results")
+    sizes = [5, 10, 15, 20]
+    store.append(
+        "Synthetic",
+        "DiMergeCo-SCC",
+        "cocluster_size",
+        0,
+        sizes,
+        nmi=[0.35, 0.60, 0.69, 0.74],
+        ari=[0.23, 0.42, 0.55, 0.62],
+    )
+    x, mean, std = store.series("Synthetic", "DiMergeCo-SCC", "cocluster_size", "nmi")
+    print(f"Store '{store.path}' holds {len(store)} values")
+    print("x:", x.tolist(), "NMI:", mean.tolist())
+
+
+if __name__ == "__main__":
+    main()
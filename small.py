@@ -15,8 +15,10 @@
 
 import pandas as pd
 import matplotlib.pyplot as plt
-from figure import *
+from layout import save_figure
+from styles import current_style, set_style, styled
 
+@styled()
 def create_performance_plot():
     # 准备数据
     sizes = ['5x5', '10x10', '15x15', '20x20']
@@ -39,8 +41,9 @@ def create_performance_plot():
     }
     
     # 设置颜色和标记
-    colors = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3"]
-    markers = ["o", "s", "^", "D"]
+    style = current_style()
+    colors = style.colors[:4]
+    markers = style.markers[:4]
     
     # 绘制NMI图
     plt.figure(figsize=(8, 6))
@@ -48,17 +51,13 @@ def create_performance_plot():
         plt.plot(sizes, nmi_data[method], marker=markers[i], markersize=8,
                 label=method, color=colors[i], linewidth=2)
     
-    plt.title("NMI Performance", pad=15, fontproperties=font_prop,
-              fontsize=BASE_FONT_SIZE * FONT_SCALES['title'])
-    plt.xlabel("Co-cluster Size", fontproperties=font_prop,
-               fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
-    plt.ylabel("NMI", fontproperties=font_prop,
-               fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
+    plt.title("NMI Performance", pad=15)
+    plt.xlabel("Co-cluster Size")
+    plt.ylabel("NMI")
     plt.grid(True, linestyle="--", alpha=0.7)
     plt.ylim(0.0, 1.0)
-    plt.legend(frameon=True, prop=legend_font)
-    plt.tight_layout()
-    plt.savefig("nmi_small.png", dpi=300, bbox_inches="tight")
+    plt.legend(frameon=True)
+    save_figure(plt.gcf(), "nmi_small.png", "small_cocluster")
     plt.close()
     
     # 绘制ARI图
@@ -67,23 +66,17 @@ def create_performance_plot():
         plt.plot(sizes, ari_data[method], marker=markers[i], markersize=8,
                 label=method, color=colors[i], linewidth=2)
     
-    plt.title("ARI Performance", pad=15, fontproperties=font_prop,
-              fontsize=BASE_FONT_SIZE * FONT_SCALES['title'])
-    plt.xlabel("Co-cluster Size", fontproperties=font_prop,
-               fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
-    plt.ylabel("ARI", fontproperties=font_prop,
-               fontsize=BASE_FONT_SIZE * FONT_SCALES['axis_label'])
+    plt.title("ARI Performance", pad=15)
+    plt.xlabel("Co-cluster Size")
+    plt.ylabel("ARI")
     plt.grid(True, linestyle="--", alpha=0.7)
     plt.ylim(0.0, 1.0)
-    plt.legend(frameon=True, prop=legend_font)
-    plt.tight_layout()
-    plt.savefig("ari_small.png", dpi=300, bbox_inches="tight")
+    plt.legend(frameon=True)
+    save_figure(plt.gcf(), "ari_small.png", "small_cocluster")
     plt.close()
 
 def main():
-    if font_prop is None:
-        print("Warning: Using default font as Times New Roman could not be loaded")
-    
+    set_style("thesis")
     create_performance_plot()
 
 if __name__ == "__main__":
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Figure Styles
+Named styles (paper, thesis, slides) compiled once into rcParams
+
+A style spec lists the font, base size and per-role scales, colors and
+markers, plus optional per-figure entries that replace some role scales or
+scale the whole figure (e.g. the larger text of the small 6 x 6 sensitivity
+plots). compile_style() resolves it once (loading font files, building the
+rcParams dict and the per-role font sizes) and caches the result.
+Figure functions decorated with @styled() run inside the active style's
+rc_context, so titles, labels, ticks and legends pick their font and size
+from rcParams instead of per-call fontproperties/fontsize arguments.
+Switching every figure to another style is a single set_style() call.
+"""
+
+import functools
+from contextlib import contextmanager
+
+import matplotlib as mpl
+from cycler import cycler
+from matplotlib import font_manager
+
+COLORS = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3", "#ff7f00", "#ffff33"]
+MARKERS = ["o", "s", "^", "D", "v", "*"]
+ROLES = ("base", "title", "axis_label", "tick_label", "legend", "annotation")
+
+STYLES = {
+    # 论文（LaTeX 渲染）：默认字号同 matplotlib 的 10pt，个别图使用更大的字号
+    "paper": dict(
+        base_size=10,
+        scales={
+            "base": 1.0,
+            "title": 1.0,
+            "axis_label": 1.0,
+            "tick_label": 1.0,
+            "legend": 1.0,
+            "annotation": 1.0,
+        },
+        figures={
+            "small_cocluster": {"title": 1.44, "axis_label": 1.2},
+            "sensitivity": {
+                "axis_label": 1.8,
+                "tick_label": 1.6,
+                "legend": 1.6,
+                "annotation": 1.6,
+            },
+            "optimization": {"title": 1.4, "annotation": 1.1},
+        },
+        family="Times New Roman",
+        usetex=True,
+    ),
+    # 学位论文（使用 Times New Roman 字体文件）
+    "thesis": dict(
+        base_size=20,
+        scales={
+            "base": 1.0,
+            "title": 1.4,
+            "axis_label": 1.2,
+            "tick_label": 1.2,
+            "legend": 1.0,
+            "annotation": 0.8,
+        },
+        figures={"sensitivity": {"scale": 1.5}},
+        family="Times New Roman",
+        font_file=(
+            "/backup/codes/actions-runner/_work/PhDThesis/PhDThesis/"
+            "Times New Roman.ttf"
+        ),
+        usetex=False,
+    ),
+    # 幻灯片（大字号）
+    "slides": dict(
+        base_size=16,
+        scales={
+            "base": 1.0,
+            "title": 1.25,
+            "axis_label": 1.125,
+            "tick_label": 1.0,
+            "legend": 1.0,
+            "annotation": 1.0,
+        },
+        figures={"sensitivity": {"scale": 1.5}},
+        family="Times New Roman",
+        usetex=True,
+    ),
+}
+
+_active_name = "paper"
+_stack = []
+
+
+class CompiledStyle:
+    """编译后的样式：rcParams、各角色字号、颜色和标记"""
+
+    def __init__(self, name, rc, sizes, colors, markers):
+        self.name = name
+        self.rc = rc
+        self.sizes = sizes
+        self.colors = colors
+        self.markers = markers
+
+    def __repr__(self):
+        return f"CompiledStyle({self.name!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_family(name):
+    """加载字体文件（如有），返回 rcParams 中使用的字体名"""
+    spec = STYLES[name]
+    font_file = spec.get("font_file")
+    if font_file:
+        try:
+            font_manager.fontManager.addfont(font_file)
+            return font_manager.FontProperties(fname=font_file).get_name()
+        except (OSError, RuntimeError) as e:
+            print(f"Error loading font: {e}")
+    if spec.get("usetex"):
+        # LaTeX 负责字体，无需在本机查找
+        return spec["family"]
+    found = font_manager.findfont(
+        font_manager.FontProperties(family=spec["family"]), fallback_to_default=True
+    )
+    if spec["family"] not in font_manager.FontProperties(fname=found).get_name():
+        print(f"Warning: {spec['family']} not found, using default font")
+        return None
+    return spec["family"]
+
+
+def compile_style(name, scale=1.0, figure=None):
+    """编译样式（结果缓存），scale 为整体字号缩放，figure 为样式中的单图设置名"""
+    if name not in STYLES:
+        raise ValueError(f"Unknown style {name!r}, choose from {sorted(STYLES)}")
+    return _compile(name, float(scale), figure)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(name, scale, figure):
+    spec = STYLES[name]
+    family = _resolve_family(name)
+    # 单图设置可替换部分角色的缩放比例，"scale" 键缩放该图的全部字号
+    overrides = dict(spec.get("figures", {}).get(figure, {}))
+    scale *= overrides.pop("scale", 1.0)
+    scales = {**spec["scales"], **overrides}
+    sizes = {role: spec["base_size"] * scales[role] * scale for role in ROLES}
+    colors = list(spec.get("colors", COLORS))
+    markers = list(spec.get("markers", MARKERS))
+
+    rc = {
+        "text.usetex": spec["usetex"],
+        "font.family": "serif",
+        "font.size": sizes["base"],
+        "axes.titlesize": sizes["title"],
+        "axes.labelsize": sizes["axis_label"],
+        "xtick.labelsize": sizes["tick_label"],
+        "ytick.labelsize": sizes["tick_label"],
+        "legend.fontsize": sizes["legend"],
+        "axes.prop_cycle": cycler(color=colors),
+    }
+    if family is not None:
+        rc["font.serif"] = [family] + [
+            f for f in mpl.rcParamsDefault["font.serif"] if f != family
+        ]
+    if spec["usetex"]:
+        rc["text.latex.preamble"] = r"\usepackage{amsmath}"
+    return CompiledStyle(name, rc, sizes, colors, markers)
+
+
+def set_style(name):
+    """设置默认样式，之后所有 @styled() 图片使用该样式"""
+    global _active_name
+    compile_style(name)
+    _active_name = name
+
+
+def current_style():
+    """当前生效的样式"""
+    return _stack[-1] if _stack else compile_style(_active_name)
+
+
+@contextmanager
+def use_style(name=None, scale=1.0, figure=None):
+    """在样式的 rc_context 中执行，name 为 None 时使用默认样式"""
+    style = compile_style(name or _active_name, scale, figure)
+    _stack.append(style)
+    try:
+        with mpl.rc_context(style.rc):
+            yield style
+    finally:
+        _stack.pop()
+
+
+def styled(scale=1.0, figure=None):
+    """装饰器：在默认样式中运行绘图函数
+
+    scale 为该图的字号缩放；figure 为样式 figures 中的单图设置名，
+    没有该设置的样式使用默认字号。
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with use_style(scale=scale, figure=figure):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Theoretical Bounds
+Vectorized detection-probability and error-bound evaluation over parameter grids
+
+An m x n matrix is split into partitions = p_r * p_c blocks (p_r = p_c when
+only the total is given) by random row and column permutations. For a
+co-cluster with M rows and N columns, the number of its rows that land in a
+given row block is hypergeometric with mean M / p_r, so by Hoeffding
+
+    f_r = exp(-2 (M / p_r - T_m)^2 / min(M, m / p_r))    if M / p_r > T_m
+    f_r = 1                                              otherwise
+
+bounds the chance that the block gets fewer than T_m co-cluster rows (f_c is
+the same for columns with N, n, p_c and T_n). One repetition of the
+partitioning then detects the co-cluster with probability at least
+
+    p = (1 - f_r) (1 - f_c)
+
+and T_p independent repetitions with probability 1 - (1 - p)^T_p. The
+smallest T_p reaching P_thresh is ceil(log(1 - P_thresh) / log(1 - p)). The
+error bound adds the per-block co-clustering error e_b of the base method:
+
+    error = 1 - (1 - miss)(1 - e_b),  miss = (1 - p)^T_p
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+OUTPUTS = ("block_probability", "repetitions", "detection_rate", "error_bound")
+
+# 各领域的示例设置（矩阵大小、co-cluster大小、分区与阈值）
+# 注意：这些不是论文实验的真实设置。Document 使用 CLASSIC4 的矩阵大小，
+# 其余矩阵和 co-cluster 大小均为演示用的整数，未针对任何结果调整；
+# 有真实实验设置时应替换这里的数值。
+DOMAIN_SETTINGS = {
+    "Document": dict(m=7095, n=5896, M=300, N=300, partitions=100, T_m=10, T_n=10),
+    "Gene Expression": dict(
+        m=4000, n=2000, M=400, N=200, partitions=100, T_m=10, T_n=10
+    ),
+    "Medical Image": dict(
+        m=10000, n=4000, M=500, N=300, partitions=100, T_m=20, T_n=10
+    ),
+    "Sensor Network": dict(
+        m=20000, n=1000, M=800, N=100, partitions=100, T_m=30, T_n=5
+    ),
+}
+
+
+def grid_splits(partitions, row_splits=None):
+    """把 partitions 个块拆成 p_r x p_c 网格，返回 (p_r, p_c)，参数可为数组
+
+    row_splits 为 None 时要求 partitions 为完全平方数（p_r = p_c）；
+    无法组成网格时报错，与 simulate 的模拟使用同一划分。
+    """
+    partitions = np.asarray(partitions)
+    if row_splits is None:
+        row_splits = np.rint(np.sqrt(partitions)).astype(np.int64)
+        if np.any(row_splits * row_splits != partitions):
+            raise ValueError(
+                f"{partitions} partitions is not a square grid, pass row_splits"
+            )
+    row_splits = np.asarray(row_splits)
+    if np.any(row_splits <= 0) or np.any(partitions % row_splits):
+        raise ValueError(
+            f"{partitions} partitions cannot be split into {row_splits} block rows"
+        )
+    return row_splits, partitions // row_splits
+
+
+def _miss_probability(size, total, splits, threshold):
+    """单个块中 co-cluster 行（或列）数少于阈值的 Hoeffding 上界"""
+    mean = size / splits
+    effective = np.minimum(size, total / splits)
+    gap = mean - threshold
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bound = np.exp(-2.0 * gap**2 / effective)
+    return np.where(gap > 0, bound, 1.0)
+
+
+def evaluate(
+    m,
+    n,
+    M,
+    N,
+    partitions,
+    T_m,
+    T_n,
+    p_thresh=0.95,
+    repetitions=None,
+    block_error=0.1,
+    row_splits=None,
+):
+    """对可广播的参数数组一次性计算检测概率与误差界
+
+    repetitions 为 None 时取满足 p_thresh 的最小重复次数；
+    row_splits 为 None 时按正方形网格划分（p_r = p_c = sqrt(partitions)），
+    划分方式见 grid_splits。返回 OUTPUTS 中各量组成的字典。
+    """
+    m, n, M, N = (np.asarray(v, dtype=np.float64) for v in (m, n, M, N))
+    p_r, p_c = grid_splits(partitions, row_splits)
+    p_r, p_c = p_r.astype(np.float64), p_c.astype(np.float64)
+
+    f_r = _miss_probability(M, m, p_r, np.asarray(T_m, dtype=np.float64))
+    f_c = _miss_probability(N, n, p_c, np.asarray(T_n, dtype=np.float64))
+    p = (1.0 - f_r) * (1.0 - f_c)
+
+    with np.errstate(divide="ignore"):
+        log_fail = np.log1p(-np.minimum(p, 1.0))
+    if repetitions is None:
+        target = np.log1p(-np.asarray(p_thresh, dtype=np.float64))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            repetitions = np.ceil(target / log_fail)
+        # p == 1 时一次即可，p == 0 时永远达不到阈值
+        repetitions = np.where(p >= 1.0, 1.0, repetitions)
+        repetitions = np.where(p <= 0.0, np.inf, repetitions)
+    else:
+        repetitions = np.asarray(repetitions, dtype=np.float64)
+
+    with np.errstate(invalid="ignore"):
+        miss = np.exp(repetitions * log_fail)
+    miss = np.where(p <= 0.0, 1.0, np.where(p >= 1.0, 0.0, miss))
+    detection_rate = 1.0 - miss
+    error_bound = 1.0 - detection_rate * (1.0 - np.asarray(block_error))
+
+    shape = np.broadcast_shapes(
+        p.shape, repetitions.shape, np.shape(block_error), np.shape(p_thresh)
+    )
+    values = (p, repetitions, detection_rate, error_bound)
+    return {name: np.broadcast_to(v, shape) for name, v in zip(OUTPUTS, values)}
+
+
+def _evaluate_chunk(axes, fixed, start, stop):
+    """计算展平网格中 [start, stop) 这一段"""
+    names = list(axes)
+    shape = tuple(len(axes[name]) for name in names)
+    flat = np.unravel_index(np.arange(start, stop), shape)
+    params = dict(fixed)
+    for name, idx in zip(names, flat):
+        params[name] = np.asarray(axes[name])[idx]
+    result = evaluate(**params)
+    return start, {
+        name: np.broadcast_to(v, (stop - start,)) for name, v in result.items()
+    }
+
+
+def evaluate_grid(chunk_size=None, workers=None, **params):
+    """在完整参数网格上计算，列表/数组参数作为网格轴，标量参数固定
+
+    返回字典，各数组形状为各轴长度（按参数给出的顺序）。
+    给定 chunk_size 时按块拆分并用进程池并行计算，适合非常大的网格。
+    """
+    axes = {}
+    fixed = {}
+    for name, value in params.items():
+        if np.ndim(value) == 0:
+            fixed[name] = value
+        else:
+            axes[name] = np.asarray(value)
+    shape = tuple(len(v) for v in axes.values())
+
+    if chunk_size is None:
+        grids = np.meshgrid(*axes.values(), indexing="ij", sparse=True)
+        result = evaluate(**fixed, **dict(zip(axes, grids)))
+        return {name: np.broadcast_to(v, shape) for name, v in result.items()}
+
+    total = int(np.prod(shape))
+    out = {name: np.empty(total, dtype=np.float64) for name in OUTPUTS}
+    bounds = [(s, min(s + chunk_size, total)) for s in range(0, total, chunk_size)]
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_evaluate_chunk, axes, fixed, start, stop)
+            for start, stop in bounds
+        ]
+        for future in futures:
+            start, chunk = future.result()
+            for name, values in chunk.items():
+                out[name][start : start + len(values)] = values
+    return {name: values.reshape(shape) for name, values in out.items()}
+
+
+def validation_inputs(settings=None, p_thresh=0.95, repetitions=None, block_error=0.1):
+    """计算各领域的预测检测率和误差界，可直接传给 create_theoretical_validation_table
+
+    repetitions 为 None 时每个领域取满足 p_thresh 的最小重复次数 T_p。
+    默认的 DOMAIN_SETTINGS 只是示例设置，结果不能作为论文数据的预测。
+    """
+    settings = DOMAIN_SETTINGS if settings is None else settings
+    columns = {
+        key: np.array([domain[key] for domain in settings.values()])
+        for key in next(iter(settings.values()))
+    }
+    result = evaluate(
+        **columns, p_thresh=p_thresh, repetitions=repetitions, block_error=block_error
+    )
+    return {
+        "domains": list(settings),
+        "predicted_rates": result["detection_rate"].tolist(),
+        "error_bounds": result["error_bound"].tolist(),
+    }
+
+
+def main(block_error=0.1):
+    """打印各领域的理论值，并与同一示例设置的模拟结果一起生成理论验证图"""
+    from response import create_theoretical_validation_table
+    from simulate import domain_empirical_rates
+
+    inputs = validation_inputs(block_error=block_error)
+    # 经验值取自相同设置的模拟，避免示例预测与论文实测数据混在同一张图中
+    empirical_rates = domain_empirical_rates()
+    actual_errors = [1.0 - rate * (1.0 - block_error) for rate in empirical_rates]
+    print("Theoretical vs simulated detection rates and error bounds:")
+    for domain, rate, empirical, bound, error in zip(
+        inputs["domains"],
+        inputs["predicted_rates"],
+        empirical_rates,
+        inputs["error_bounds"],
+        actual_errors,
+    ):
+        print(
+            f"  {domain:<16s} detection {rate:.3f} / {empirical:.3f}  "
+            f"error {bound:.3f} / {error:.3f}"
+        )
+    create_theoretical_validation_table(
+        **inputs, empirical_rates=empirical_rates, actual_errors=actual_errors
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Trace Analysis
+Scaling-efficiency dashboard built from per-node, per-partition timing traces
+
+A trace has one row per (dataset, nodes, node, partition, phase) with the
+phase duration in seconds, or start/end timestamps instead of seconds. Phases
+are "compute", "communication" and "merge". A node runs its phases one after
+another, so the wall time of a run is the slowest node's total; the gap
+between that and a node's own total is time spent waiting on stragglers.
+"""
+
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import layout
+from styles import current_style, styled
+
+PHASES = ["compute", "communication", "merge"]
+PHASE_COLORS = {
+    "compute": "#377eb8",
+    "communication": "#ff7f00",
+    "merge": "#4daf4a",
+    "wait": "#bbbbbb",
+}
+
+
+def load_traces(path):
+    """读取 CSV 或 Parquet 格式的 trace"""
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    if "seconds" not in df:
+        df["seconds"] = df["end"] - df["start"]
+    return df
+
+
+def synthetic_traces(datasets=None, node_counts=(1, 4, 8, 16, 24), seed=0):
+    """生成模拟 trace：计算量随节点数摊薄，通信与合并开销随节点数增长"""
+    if datasets is None:
+        # 每个数据集: (总计算量 s, 分区数, 通信系数, 合并系数, 负载偏斜)
+        datasets = {
+            "Amazon 1000": (2400.0, 100, 12.0, 0.6, 0.45),
+            "Classic4": (1800.0, 100, 7.0, 0.22, 0.15),
+            "RCV1-Large": (3600.0, 100, 12.0, 0.6, 0.30),
+        }
+    rng = np.random.default_rng(seed)
+    frames = []
+    for dataset, (work, partitions, comm, merge, skew) in datasets.items():
+        weights = rng.lognormal(0.0, skew, partitions)
+        compute = work * weights / weights.sum()
+        for nodes in node_counts:
+            node = np.arange(partitions) % nodes
+            partition = np.arange(partitions)
+            per_node = np.bincount(node, minlength=nodes)[node]
+            # 通信：结果汇总到合并节点，每个节点的代价随节点数对数增长
+            communication = comm * np.log2(nodes) / per_node
+            # 合并：层次合并的层数和每层数据量都随节点数增长
+            merge_time = merge * nodes * (1 + np.log2(nodes)) / per_node
+            for phase, seconds in zip(PHASES, (compute, communication, merge_time)):
+                noise = rng.normal(1.0, 0.03, partitions)
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "dataset": dataset,
+                            "nodes": nodes,
+                            "node": node,
+                            "partition": partition,
+                            "phase": phase,
+                            "seconds": seconds * noise,
+                        }
+                    )
+                )
+    return pd.concat(frames, ignore_index=True)
+
+
+def node_phase_times(df):
+    """每个节点各阶段的总时间：索引 (dataset, nodes, node)，列为阶段"""
+    table = df.pivot_table(
+        index=["dataset", "nodes", "node"],
+        columns="phase",
+        values="seconds",
+        aggfunc="sum",
+        fill_value=0.0,
+    )
+    return table.reindex(columns=PHASES, fill_value=0.0)
+
+
+def run_summary(df):
+    """每次运行的汇总：墙钟时间、效率、负载不均衡及各阶段平均时间"""
+    per_node = node_phase_times(df)
+    totals = per_node.sum(axis=1)
+    grouped = totals.groupby(level=["dataset", "nodes"])
+    summary = pd.DataFrame(
+        {
+            "wall": grouped.max(),
+            "mean_node": grouped.mean(),
+            "imbalance": grouped.max() / grouped.mean() - 1.0,
+        }
+    )
+    phase_means = per_node.groupby(level=["dataset", "nodes"]).mean()
+    summary = summary.join(phase_means)
+    summary["wait"] = summary["wall"] - summary["mean_node"]
+
+    # 效率 E(p) = T(1) / (p * T(p))，以各数据集最少节点数的运行为基准
+    summary = summary.reset_index()
+    base = summary.loc[summary.groupby("dataset")["nodes"].idxmin()]
+    base_work = (base["wall"] * base["nodes"]).to_numpy()
+    base_work = pd.Series(base_work, index=base["dataset"].to_numpy())
+    summary["efficiency"] = summary["dataset"].map(base_work) / (
+        summary["nodes"] * summary["wall"]
+    )
+    return summary
+
+
+def stragglers(df, dataset, nodes, k=3.0):
+    """找出总时间超过 中位数 + k * MAD 的节点，返回 (各节点总时间, 阈值)"""
+    per_node = node_phase_times(df).loc[(dataset, nodes)]
+    totals = per_node.sum(axis=1)
+    median = totals.median()
+    mad = (totals - median).abs().median()
+    return totals, median + k * max(mad, 1e-9)
+
+
+@styled()
+def create_scaling_dashboard(df, dataset=None, filename="scaling_dashboard.png"):
+    """绘制扩展效率仪表板：效率、阶段分解、负载不均衡和慢节点"""
+    print("Creating scaling-efficiency dashboard...")
+    style = current_style()
+    summary = run_summary(df)
+    datasets = list(summary["dataset"].unique())
+    if dataset is None:
+        dataset = datasets[0]
+
+    fig, axes = plt.subplots(2, 2, figsize=(12, 9))
+
+    # (a) 由 trace 计算的效率
+    for i, name in enumerate(datasets):
+        rows = summary[summary["dataset"] == name]
+        axes[0, 0].plot(
+            rows["nodes"],
+            rows["efficiency"],
+            marker=style.markers[i],
+            markersize=8,
+            label=name,
+            color=style.colors[i],
+            linewidth=2,
+        )
+    axes[0, 0].set_xlabel("Number of Nodes")
+    axes[0, 0].set_ylabel("Efficiency")
+    axes[0, 0].set_title("(a) Efficiency from Traces")
+    axes[0, 0].set_ylim(0.0, 1.1)
+    axes[0, 0].grid(True, linestyle="--", alpha=0.7)
+    axes[0, 0].legend()
+
+    # (b) 各阶段平均时间的堆叠图
+    rows = summary[summary["dataset"] == dataset]
+    x = np.arange(len(rows))
+    bottom = np.zeros(len(rows))
+    for phase in PHASES + ["wait"]:
+        values = rows[phase].to_numpy()
+        axes[0, 1].bar(
+            x,
+            values,
+            0.6,
+            bottom=bottom,
+            label=phase.capitalize(),
+            color=PHASE_COLORS[phase],
+        )
+        bottom += values
+    axes[0, 1].set_xticks(x)
+    axes[0, 1].set_xticklabels(rows["nodes"].tolist())
+    axes[0, 1].set_xlabel("Number of Nodes")
+    axes[0, 1].set_ylabel("Time per Node (s)")
+    axes[0, 1].set_title(f"(b) Phase Breakdown ({dataset})")
+    axes[0, 1].grid(True, axis="y", alpha=0.3)
+    axes[0, 1].legend()
+
+    # (c) 负载不均衡
+    for i, name in enumerate(datasets):
+        rows = summary[summary["dataset"] == name]
+        axes[1, 0].plot(
+            rows["nodes"],
+            rows["imbalance"] * 100,
+            marker=style.markers[i],
+            markersize=8,
+            label=name,
+            color=style.colors[i],
+            linewidth=2,
+        )
+    axes[1, 0].set_xlabel("Number of Nodes")
+    axes[1, 0].set_ylabel("Load Imbalance (max / mean - 1, %)")
+    axes[1, 0].set_title("(c) Load Imbalance")
+    axes[1, 0].grid(True, linestyle="--", alpha=0.7)
+    axes[1, 0].legend()
+
+    # (d) 最大规模运行中各节点的总时间
+    nodes = int(summary.loc[summary["dataset"] == dataset, "nodes"].max())
+    totals, threshold = stragglers(df, dataset, nodes)
+    colors = np.where(totals.to_numpy() > threshold, "#e41a1c", "#377eb8")
+    axes[1, 1].bar(totals.index.to_numpy(), totals.to_numpy(), color=colors)
+    axes[1, 1].axhline(totals.median(), color="black", linestyle="--", label="Median")
+    axes[1, 1].axhline(
+        threshold, color="red", linestyle="--", label="Straggler Threshold"
+    )
+    axes[1, 1].set_xlabel("Node")
+    axes[1, 1].set_ylabel("Total Time (s)")
+    axes[1, 1].set_title(f"(d) Per-node Time ({dataset}, {nodes} nodes)")
+    axes[1, 1].grid(True, axis="y", alpha=0.3)
+    axes[1, 1].legend(loc="lower right")
+
+    layout.save_figure(fig, filename, "scaling_dashboard")
+    plt.close()
+
+    print("Scaling-efficiency dashboard saved:")
+    print(f"7. {filename} - Phase breakdown, load imbalance and stragglers")
+    return summary
+
+
+def main():
+    """python traces.py [trace.csv]，未给出 trace 时使用模拟数据"""
+    if len(sys.argv) > 1:
+        df = load_traces(sys.argv[1])
+    else:
+        print("No trace file given, using synthetic traces")
+        df = synthetic_traces()
+    summary = create_scaling_dashboard(df)
+    columns = ["dataset", "nodes", "wall", "efficiency", "imbalance"] + PHASES
+    print(summary[columns].to_string(index=False, float_format="%.2f"))
+
+
+if __name__ == "__main__":
+    main()
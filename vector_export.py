@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiMergeCo Vector Export
+Compact PDF/SVG output with automatic rasterization of dense artists
+
+Every line, collection and bar group with more than max_elements points,
+markers or patches is rasterized at raster_dpi while axes, ticks and text
+stay vector. An axes whose artists together still exceed a per-axes total
+(say a sweep drawn as thousands of short lines) has its largest artists
+rasterized too, until the vector remainder fits. Consecutive rasterized
+artists are merged into one image by matplotlib, so file size stops growing
+with the number of plotted points. The artists' own rasterization flags are
+restored once the file is written.
+Streams are compressed and paths simplified.
+
+Styles without usetex (thesis) embed fonts as subsetted TrueType (Type 42)
+instead of Type 3. Under usetex (paper, slides) the PDF backend embeds the
+TeX Type 1 fonts and pdf.fonttype has no effect. Either way a PDF embeds
+each font once per file, so MultipageExport / export_multipage(), which
+write several figures into one PDF, avoid repeating the fonts in every
+figure; response.PDF_PAGES routes the paper figures through it.
+"""
+
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import Collection
+from matplotlib.container import BarContainer
+
+ExportReport = namedtuple(
+    "ExportReport", ["path", "format", "nbytes", "elements", "rasterized"]
+)
+
+VECTOR_RC = {
+    "pdf.fonttype": 42,
+    "ps.fonttype": 42,
+    "pdf.compression": 9,
+    "svg.hashsalt": "dimergeco",
+    "path.simplify": True,
+    "path.simplify_threshold": 0.1,
+}
+
+
+def count_elements(artist):
+    """artist 中的数据点、标记或图形数量"""
+    if isinstance(artist, Collection):
+        return max(len(artist.get_offsets()), len(artist.get_paths()))
+    if hasattr(artist, "get_xydata"):
+        return len(artist.get_xydata())
+    return 1
+
+
+def _artist_groups(ax):
+    """按绘图对象分组：每条曲线、每个集合、每组柱状图，其余图形作为一组"""
+    groups = [[line] for line in ax.lines] + [[c] for c in ax.collections]
+    grouped = set()
+    for container in ax.containers:
+        if isinstance(container, BarContainer):
+            groups.append(list(container.patches))
+            grouped.update(map(id, container.patches))
+    others = [p for p in ax.patches if id(p) not in grouped]
+    if others:
+        groups.append(others)
+    return groups
+
+
+@contextmanager
+def rasterize_dense(fig, max_elements=1000, axes_max_elements=None):
+    """在 with 块中把密集的绘图对象设为栅格化，产出 (元素总数, 栅格化个数)
+
+    超过 max_elements 个元素的对象栅格化；一个坐标轴中其余对象的元素总数
+    仍超过 axes_max_elements（默认等于 max_elements）时，从最大的对象起
+    继续栅格化，直到剩余的矢量元素不超过该值（如成千上万条短曲线）。
+    退出时恢复各对象原来的栅格化设置。
+    """
+    if axes_max_elements is None:
+        axes_max_elements = max_elements
+    total = 0
+    dense = []
+    for ax in fig.axes:
+        counted = [
+            (sum(count_elements(artist) for artist in group), group)
+            for group in _artist_groups(ax)
+        ]
+        counted.sort(key=lambda item: item[0], reverse=True)
+        vector = sum(count for count, _ in counted)
+        total += vector
+        for count, group in counted:
+            if count <= max_elements and vector <= axes_max_elements:
+                break
+            dense.extend(group)
+            vector -= count
+
+    previous = [artist.get_rasterized() for artist in dense]
+    try:
+        for artist in dense:
+            artist.set_rasterized(True)
+        yield total, len(dense)
+    finally:
+        for artist, flag in zip(dense, previous):
+            artist.set_rasterized(flag)
+
+
+def export(fig, path, max_elements=1000, raster_dpi=300, bbox="tight"):
+    """导出 PDF/SVG（由扩展名决定），返回 ExportReport"""
+    fmt = os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in ("pdf", "svg", "eps", "ps"):
+        raise ValueError(f"Not a vector format: {path}")
+    with rasterize_dense(fig, max_elements) as (elements, rasterized):
+        with mpl.rc_context(VECTOR_RC):
+            fig.savefig(path, dpi=raster_dpi, bbox_inches=bbox)
+    return ExportReport(path, fmt, os.path.getsize(path), elements, rasterized)
+
+
+class MultipageExport:
+    """逐页写入同一个 PDF（每种字体只嵌入一次），close() 后返回 ExportReport"""
+
+    def __init__(self, path, max_elements=1000, raster_dpi=300):
+        self.path = path
+        self.max_elements = max_elements
+        self.raster_dpi = raster_dpi
+        self.elements = 0
+        self.rasterized = 0
+        self.report = None
+        with mpl.rc_context(VECTOR_RC):
+            self._pdf = PdfPages(path)
+
+    def add(self, fig, bbox="tight"):
+        """把 fig 写为新的一页；bbox 为裁剪边界框（英寸），默认按紧凑边界框裁剪"""
+        with rasterize_dense(fig, self.max_elements) as (elements, rasterized):
+            with mpl.rc_context(VECTOR_RC):
+                self._pdf.savefig(fig, dpi=self.raster_dpi, bbox_inches=bbox)
+        self.elements += elements
+        self.rasterized += rasterized
+
+    def close(self):
+        if self.report is None:
+            with mpl.rc_context(VECTOR_RC):
+                self._pdf.close()
+            self.report = ExportReport(
+                self.path,
+                "pdf",
+                os.path.getsize(self.path),
+                self.elements,
+                self.rasterized,
+            )
+        return self.report
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_multipage(figs, path, max_elements=1000, raster_dpi=300):
+    """把多张图写入同一个 PDF，返回 ExportReport"""
+    with MultipageExport(path, max_elements, raster_dpi) as pdf:
+        for fig in figs:
+            pdf.add(fig)
+    return pdf.report
+
+
+def print_report(report):
+    print(
+        f"   {report.path}: {report.nbytes / 1024:.0f} KiB, "
+        f"{report.elements} elements, {report.rasterized} artists rasterized"
+    )
+
+
+def main():
+    """把论文图片导出到同一个 PDF，并比较密集曲线栅格化前后的大小"""
+    import matplotlib.pyplot as plt
+
+    import response
+
+    with MultipageExport("paper_figures.pdf") as pdf:
+        response.PDF_PAGES = pdf
+        response.create_optimization_figure()
+        response.create_cross_domain_performance()
+        response.create_theoretical_validation_table()
+    response.PDF_PAGES = None
+    print_report(pdf.report)
+
+    # 大规模扫描：10 万个点的曲线
+    fig, ax = plt.subplots(figsize=(8, 6))
+    x = np.linspace(0, 1, 100_000)
+    ax.plot(x, np.sin(40 * x) + np.random.default_rng(0).normal(0, 0.1, x.size))
+    print_report(export(fig, "dense_sweep_vector.pdf", max_elements=np.inf))
+    print_report(export(fig, "dense_sweep.pdf"))
+    plt.close(fig)
+
+    # 同样规模但画成 5000 条 10 个点的短曲线
+    fig, ax = plt.subplots(figsize=(8, 6))
+    rng = np.random.default_rng(0)
+    for start in rng.random(5000):
+        x = start + np.linspace(0, 0.01, 10)
+        ax.plot(x, np.sin(40 * x) + rng.normal(0, 0.1, x.size), color="C0", lw=0.5)
+    print_report(export(fig, "dense_segments.pdf"))
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()